@@ -204,14 +204,17 @@ class Game:
 
         while char.stat_points > 0:
             clear_screen()
-            print(f"\nStat Points Available: {char.stat_points}\n")
-            print(f"1. Max HP: {char.get_stat('max_hp')}")
-            print(f"2. Strength: {char.get_stat('strength')}")
-            print(f"3. Defense: {char.get_stat('defense')}")
-            print(f"4. Agility: {char.get_stat('agility')}")
-            print(f"5. Intelligence: {char.get_stat('intelligence')}")
-            print(f"6. Luck: {char.get_stat('luck')}")
-            print("0. Done")
+            lines = [
+                f"\nStat Points Available: {char.stat_points}\n",
+                f"1. Max HP: {char.get_stat('max_hp')}",
+                f"2. Strength: {char.get_stat('strength')}",
+                f"3. Defense: {char.get_stat('defense')}",
+                f"4. Agility: {char.get_stat('agility')}",
+                f"5. Intelligence: {char.get_stat('intelligence')}",
+                f"6. Luck: {char.get_stat('luck')}",
+                "0. Done"
+            ]
+            print('\n'.join(lines))
 
             choice = get_number("\nAllocate to which stat? ", min_val=0, max_val=6)
 
@@ -479,7 +482,8 @@ class Game:
         clear_screen()
 
         char = self.game_state.character
-        location = self.game_state.world.get_current_location()
+        world = self.game_state.world
+        location = world.get_current_location()
 
         if not location or not location.enemy_encounters:
             print("\nNo enemies in this area.")
@@ -490,7 +494,7 @@ class Game:
         loading_animation("Searching", duration=1.5)
 
         # Always find an enemy when actively searching
-        enemy_id = location.get_random_enemy()
+        enemy_id = location.get_random_enemy(world.rng)
 
         if enemy_id:
             enemy = create_enemy(enemy_id)
@@ -615,7 +619,9 @@ class Game:
         """Explore the current area for treasures."""
         clear_screen()
 
-        location = self.game_state.world.get_current_location()
+        world = self.game_state.world
+        location = world.get_current_location()
+        rng = world.rng
 
         if not location:
             print("\nNowhere to explore.")
@@ -627,7 +633,7 @@ class Game:
 
         # Check for treasure
         if location.has_available_treasure():
-            treasure_id = location.get_treasure()
+            treasure_id = location.get_treasure(rng)
 
             if treasure_id:
                 treasure = get_item(treasure_id)
@@ -643,7 +649,7 @@ class Game:
                     )
 
                     # Discover crafting recipe randomly
-                    if random.random() < 0.3:
+                    if rng.random() < 0.3:
                         all_recipes = list(self.game_state.crafting_system.recipes.keys())
                         undiscovered = [
                             r for r in all_recipes
@@ -651,7 +657,7 @@ class Game:
                         ]
 
                         if undiscovered:
-                            recipe_id = random.choice(undiscovered)
+                            recipe_id = rng.choice(undiscovered)
                             if self.game_state.crafting_system.discover_recipe(recipe_id):
                                 recipe = self.game_state.crafting_system.get_recipe(recipe_id)
                                 print(f"\n📜 Discovered recipe: {recipe.name}!")
@@ -663,8 +669,8 @@ class Game:
             print("\nNothing found. This area has been thoroughly searched.")
 
         # Random encounter chance
-        if random.random() < 0.3:
-            enemy_id = location.get_random_enemy()
+        if rng.random() < 0.3:
+            enemy_id = location.get_random_enemy(rng)
             if enemy_id:
                 print("\n⚠️ Enemy ambush!")
                 pause()
@@ -727,13 +733,13 @@ class Game:
             pause()
             return
 
-        print("\nAvailable Quests:")
+        lines = ["\nAvailable Quests:"]
         for i, quest in enumerate(quests, 1):
-            print(f"\n{i}. {quest.name} (Lv.{quest.level_requirement})")
-            print(f"   {quest.description}")
-            print(f"   Rewards: {quest.xp_reward} XP, {quest.gold_reward} Gold")
-
-        print("0. Back")
+            lines.append(f"\n{i}. {quest.name} (Lv.{quest.level_requirement})")
+            lines.append(f"   {quest.description}")
+            lines.append(f"   Rewards: {quest.xp_reward} XP, {quest.gold_reward} Gold")
+        lines.append("0. Back")
+        print('\n'.join(lines))
 
         choice = get_number("\nAccept which quest? ", min_val=0, max_val=len(quests))
 
@@ -2,26 +2,45 @@
 Quest module - Manages quests, objectives, and rewards.
 """
 
-from typing import Dict, List, Optional, Callable
-from enum import Enum
+import copy
+import heapq
+import sys
+import weakref
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Callable, Set, Tuple
+from enum import IntEnum
+from items import get_item
 
+_BORDER = '=' * 60
 
-class QuestStatus(Enum):
-    """Quest status states."""
-    NOT_STARTED = "not_started"
-    ACTIVE = "active"
-    COMPLETED = "completed"
-    FAILED = "failed"
 
+class QuestStatus(IntEnum):
+    """Quest status states. Saved as their integer values."""
+    NOT_STARTED = 0
+    ACTIVE = 1
+    COMPLETED = 2
+    FAILED = 3
 
-class ObjectiveType(Enum):
-    """Types of quest objectives."""
-    KILL_ENEMY = "kill_enemy"
-    COLLECT_ITEM = "collect_item"
-    VISIT_LOCATION = "visit_location"
-    DELIVER_ITEM = "deliver_item"
-    TALK_TO_NPC = "talk_to_npc"
-    REACH_LEVEL = "reach_level"
+
+_STATUS_DISPLAY = {
+    QuestStatus.NOT_STARTED: "Not Started",
+    QuestStatus.ACTIVE: "Active",
+    QuestStatus.COMPLETED: "Completed",
+    QuestStatus.FAILED: "Failed"
+}
+
+
+class ObjectiveType(IntEnum):
+    """
+    Types of quest objectives.
+    Members are singletons, so they are compared by identity.
+    """
+    KILL_ENEMY = 0
+    COLLECT_ITEM = 1
+    VISIT_LOCATION = 2
+    DELIVER_ITEM = 3
+    TALK_TO_NPC = 4
+    REACH_LEVEL = 5
 
 
 class Objective:
@@ -29,22 +48,53 @@ class Objective:
     Represents a quest objective.
     """
 
+    __slots__ = ('objective_id', 'description', 'objective_type', 'target',
+                 'required_amount', 'current_amount', '_completed', '_on_complete',
+                 '_on_progress', '_pending_prefix', '_required_str', '_complete_str')
+
     def __init__(self, objective_id: str, description: str,
                  objective_type: ObjectiveType, target: str,
                  required_amount: int = 1):
         self.objective_id = objective_id
         self.description = description
         self.objective_type = objective_type
-        self.target = target  # Enemy ID, item ID, location ID, etc.
+        self.target = sys.intern(target)  # Enemy ID, item ID, location ID, etc.
         self.required_amount = required_amount
         self.current_amount = 0
-        self.completed = False
+        self._completed = False
+        # Notified with the new state whenever completion flips (set by Quest)
+        self._on_complete: Optional[Callable[[bool], None]] = None
+        # Called after any change to current_amount (set by Quest)
+        self._on_progress: Optional[Callable[[], None]] = None
+
+        # Fixed parts of the progress string
+        self._pending_prefix = f"○ {description} ("
+        self._required_str = f"/{required_amount})"
+        self._complete_str = f"✓ {description}"
+
+    @property
+    def completed(self) -> bool:
+        """Whether the objective is complete."""
+        return self._completed
+
+    @completed.setter
+    def completed(self, value: bool):
+        value = bool(value)
+        if value != self._completed:
+            self._completed = value
+            if self._on_complete:
+                self._on_complete(value)
 
     def update_progress(self, amount: int = 1):
         """Update objective progress."""
-        self.current_amount = min(self.required_amount, self.current_amount + amount)
-        if self.current_amount >= self.required_amount:
+        current = self.current_amount + amount
+        if current >= self.required_amount:
+            self.current_amount = self.required_amount
             self.completed = True
+        else:
+            self.current_amount = current
+        if self._on_progress:
+            self._on_progress()
 
     def is_complete(self) -> bool:
         """Check if objective is complete."""
@@ -52,9 +102,18 @@ class Objective:
 
     def get_progress_string(self) -> str:
         """Get progress as a string."""
-        if self.completed:
-            return f"✓ {self.description}"
-        return f"○ {self.description} ({self.current_amount}/{self.required_amount})"
+        if self._completed:
+            return self._complete_str
+        return self._pending_prefix + str(self.current_amount) + self._required_str
+
+    def __copy__(self) -> 'Objective':
+        """Copy the objective, detached from its quest's callback."""
+        clone = object.__new__(Objective)
+        for name in Objective.__slots__:
+            setattr(clone, name, getattr(self, name))
+        clone._on_complete = None
+        clone._on_progress = None
+        return clone
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -75,6 +134,11 @@ class Quest:
     Represents a quest with objectives and rewards.
     """
 
+    __slots__ = ('quest_id', 'name', 'description', 'objectives',
+                 'level_requirement', 'xp_reward', 'gold_reward',
+                 'item_rewards', 'prerequisite_quests', 'status', '_obj_index',
+                 '_incomplete', '_rewards_block', '_prereq_mask', '_manager')
+
     def __init__(self, quest_id: str, name: str, description: str,
                  objectives: List[Objective], level_requirement: int = 1,
                  xp_reward: int = 0, gold_reward: int = 0,
@@ -90,36 +154,96 @@ class Quest:
         self.item_rewards = item_rewards or []
         self.prerequisite_quests = prerequisite_quests or []
         self.status = QuestStatus.NOT_STARTED
+        self._bind_objectives()
+
+        # Rewards never change, so their display lines are built once
+        self._rewards_block = self._build_rewards_block()
 
-    def can_start(self, character, completed_quests: set) -> tuple:
+        # Bit per prerequisite quest, assigned when registered with a manager
+        self._prereq_mask = 0
+
+        # Weak reference to the owning QuestManager, told about progress
+        # changes so it can refresh its cached display
+        self._manager: Optional[weakref.ref] = None
+
+    def _bind_objectives(self):
+        """Index the objectives and hook up their completion callbacks."""
+        # Group objectives by (type, target) so progress events resolve
+        # to their objectives with a single lookup
+        self._obj_index: Dict[Tuple[ObjectiveType, str], List[Objective]] = {}
+        for objective in self.objectives:
+            key = (objective.objective_type, objective.target)
+            self._obj_index.setdefault(key, []).append(objective)
+            objective._on_complete = self._on_objective_complete
+            objective._on_progress = self._touch
+
+        # Count of unfinished objectives, kept current by the callbacks
+        self._incomplete = sum(1 for obj in self.objectives if not obj.completed)
+
+    def __copy__(self) -> 'Quest':
+        """
+        Copy the quest with its own objectives, so progress on the copy
+        leaves the original untouched. Definition data is shared.
+        """
+        clone = object.__new__(Quest)
+        for name in Quest.__slots__:
+            setattr(clone, name, getattr(self, name))
+        clone.objectives = [copy.copy(obj) for obj in self.objectives]
+        clone._bind_objectives()
+        return clone
+
+    def _on_objective_complete(self, completed: bool):
+        """Track an objective's completion state changing."""
+        self._incomplete += -1 if completed else 1
+        self._touch()
+
+    def _touch(self):
+        """Tell the owning manager this quest's displayed state changed."""
+        ref = self._manager
+        if ref is not None:
+            manager = ref()
+            if manager is not None:
+                manager._active_dirty = True
+
+    def objective_keys(self):
+        """Get the (type, target) pairs this quest's objectives listen for."""
+        return self._obj_index.keys()
+
+    def can_start(self, character, completed_quests: set,
+                  completed_mask: Optional[int] = None) -> tuple:
         """
         Check if quest can be started.
+        completed_mask, when given, is the manager's completion bitmask and
+        replaces the per-prerequisite set lookups.
         Returns (can_start: bool, reason: str).
         """
-        if self.status != QuestStatus.NOT_STARTED:
+        if self.status is not QuestStatus.NOT_STARTED:
             return False, "Quest already started or completed."
 
         if character.level < self.level_requirement:
             return False, f"Requires level {self.level_requirement}."
 
-        for prereq in self.prerequisite_quests:
-            if prereq not in completed_quests:
+        if completed_mask is not None:
+            if completed_mask & self._prereq_mask != self._prereq_mask:
                 return False, "Missing prerequisite quest."
+        else:
+            for prereq in self.prerequisite_quests:
+                if prereq not in completed_quests:
+                    return False, "Missing prerequisite quest."
 
         return True, ""
 
     def start(self):
         """Start the quest."""
         self.status = QuestStatus.ACTIVE
+        self._touch()
 
     def update_objective(self, objective_type: ObjectiveType, target: str, amount: int = 1):
         """
         Update progress for objectives matching type and target.
         """
-        for objective in self.objectives:
-            if (objective.objective_type == objective_type and
-                    objective.target == target and
-                    not objective.completed):
+        for objective in self._obj_index.get((objective_type, target), ()):
+            if not objective.completed:
                 objective.update_progress(amount)
 
     def check_completion(self) -> bool:
@@ -127,10 +251,7 @@ class Quest:
         Check if all objectives are complete.
         Returns True if quest can be completed.
         """
-        if self.status != QuestStatus.ACTIVE:
-            return False
-
-        return all(obj.is_complete() for obj in self.objectives)
+        return self.status is QuestStatus.ACTIVE and self._incomplete == 0
 
     def complete(self) -> bool:
         """
@@ -141,58 +262,71 @@ class Quest:
             return False
 
         self.status = QuestStatus.COMPLETED
+        self._touch()
         return True
 
     def fail(self):
         """Mark quest as failed."""
         self.status = QuestStatus.FAILED
+        self._touch()
 
-    def get_progress_display(self) -> str:
-        """Get formatted quest progress."""
-        output = []
-        output.append(f"\n{'='*60}")
-        output.append(f"📜 {self.name}")
-        output.append(f"{'='*60}")
-        output.append(f"{self.description}")
-        output.append(f"\nStatus: {self.status.value.replace('_', ' ').title()}")
-
-        if self.status == QuestStatus.ACTIVE:
-            output.append(f"\nObjectives:")
-            for obj in self.objectives:
-                output.append(f"  {obj.get_progress_string()}")
-
-        output.append(f"\nRewards:")
+    def _build_rewards_block(self) -> str:
+        """Format the rewards section of the progress display."""
+        lines = ["\nRewards:"]
         if self.xp_reward > 0:
-            output.append(f"  • {self.xp_reward} XP")
+            lines.append(f"  • {self.xp_reward} XP")
         if self.gold_reward > 0:
-            output.append(f"  • {self.gold_reward} Gold")
+            lines.append(f"  • {self.gold_reward} Gold")
         if self.item_rewards:
-            from items import get_item
             for item_id in self.item_rewards:
                 item = get_item(item_id)
                 if item:
-                    output.append(f"  • {item.name}")
+                    lines.append(f"  • {item.name}")
+        return '\n'.join(lines)
 
-        output.append(f"{'='*60}\n")
+    def get_progress_display(self) -> str:
+        """Get formatted quest progress."""
+        output = [
+            f"\n{_BORDER}",
+            f"📜 {self.name}",
+            _BORDER,
+            self.description,
+            f"\nStatus: {_STATUS_DISPLAY[self.status]}"
+        ]
+
+        if self.status is QuestStatus.ACTIVE:
+            output.append("\nObjectives:")
+            for obj in self.objectives:
+                output.append(f"  {obj.get_progress_string()}")
+
+        output.append(self._rewards_block)
+        output.append(f"{_BORDER}\n")
         return '\n'.join(output)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for saving."""
         return {
             'quest_id': self.quest_id,
-            'status': self.status.value,
+            'status': int(self.status),
             'objectives': [obj.to_dict() for obj in self.objectives]
         }
 
     def from_dict(self, data: Dict):
         """Load from dictionary."""
-        self.status = QuestStatus(data.get('status', 'not_started'))
+        status = data.get('status', QuestStatus.NOT_STARTED)
+        if isinstance(status, str):
+            # Older saves stored the status name, e.g. "not_started"
+            status = QuestStatus[status.upper()]
+        self.status = QuestStatus(status)
 
         objectives_data = data.get('objectives', [])
         for i, obj_data in enumerate(objectives_data):
             if i < len(self.objectives):
                 self.objectives[i].from_dict(obj_data)
 
+        self._incomplete = sum(1 for obj in self.objectives if not obj.completed)
+        self._touch()
+
 
 class QuestManager:
     """
@@ -203,10 +337,113 @@ class QuestManager:
         self.available_quests: Dict[str, Quest] = {}
         self.active_quests: Dict[str, Quest] = {}
         self.completed_quests: set = set()
+        # Snapshot of each quest as registered, used to rebuild state on load
+        self._templates: Dict[str, Quest] = {}
+        # Same information as completed_quests, one bit per quest ordinal
+        self.completed_mask = 0
+        # Active quests grouped by the (type, target) events they listen for
+        self._active_by_key: Dict[Tuple[ObjectiveType, str], List[Quest]] = {}
+        # Progress events queued while inside batch_events()
+        self._pending_events: Optional[List[Tuple[ObjectiveType, str, int]]] = None
+        # Last display_active_quests output, rebuilt when marked dirty
+        self._active_display_cache: Optional[str] = None
+        self._active_dirty = True
+
+        # Unlock tracking for available quests. A quest waits in
+        # _blocked_by_prereq until its prerequisites are completed, then in
+        # the _blocked_by_level heap until the character is high enough
+        # level, and finally sits in _ready.
+        self._ordinals: Dict[str, int] = {}
+        self._blocked_by_prereq: Dict[str, Set[str]] = {}
+        self._unmet_prereqs: Dict[str, int] = {}
+        self._blocked_by_level: List[Tuple[int, int, str]] = []
+        self._ready: Dict[str, Quest] = {}
+        self._unlocked_level = 0
 
     def register_quest(self, quest: Quest):
         """Register a quest as available."""
         self.available_quests[quest.quest_id] = quest
+        quest._manager = weakref.ref(self)
+        self._ordinal(quest.quest_id)
+        quest._prereq_mask = 0
+        for prereq in quest.prerequisite_quests:
+            quest._prereq_mask |= 1 << self._ordinal(prereq)
+        # Copied after the mask is set, so quests restored by from_dict keep it
+        self._templates[quest.quest_id] = copy.copy(quest)
+        self._track_unlock(quest)
+
+    def bulk_register(self, table):
+        """
+        Build and register quests from rows shaped like QUEST_TABLE.
+        Returns the number of quests registered.
+        """
+        register = self.register_quest
+        for (quest_id, name, description, objectives, level_requirement,
+             xp_reward, gold_reward, item_rewards, prerequisite_quests) in table:
+            register(Quest(
+                quest_id, name, description,
+                [Objective(*row) for row in objectives],
+                level_requirement, xp_reward, gold_reward,
+                item_rewards, prerequisite_quests
+            ))
+        return len(table)
+
+    def _ordinal(self, quest_id: str) -> int:
+        """Get the bit position for a quest ID, assigning the next free one."""
+        return self._ordinals.setdefault(quest_id, len(self._ordinals))
+
+    def _track_unlock(self, quest: Quest):
+        """Place an available quest in the bucket matching what blocks it."""
+        unmet = [p for p in quest.prerequisite_quests if p not in self.completed_quests]
+        if unmet:
+            self._unmet_prereqs[quest.quest_id] = len(unmet)
+            for prereq in unmet:
+                self._blocked_by_prereq.setdefault(prereq, set()).add(quest.quest_id)
+        else:
+            heapq.heappush(self._blocked_by_level,
+                           (quest.level_requirement, self._ordinals[quest.quest_id], quest.quest_id))
+
+    def _rebuild_unlock_index(self):
+        """Recompute unlock tracking from the available quests."""
+        self._blocked_by_prereq = {}
+        self._unmet_prereqs = {}
+        self._blocked_by_level = []
+        self._ready = {}
+        self._unlocked_level = 0
+        for quest in self.available_quests.values():
+            self._track_unlock(quest)
+
+    def _release_prerequisite(self, quest_id: str):
+        """Unblock quests that were waiting on a newly completed quest."""
+        for waiting_id in self._blocked_by_prereq.pop(quest_id, ()):
+            self._unmet_prereqs[waiting_id] -= 1
+            if self._unmet_prereqs[waiting_id] == 0:
+                del self._unmet_prereqs[waiting_id]
+                quest = self.available_quests.get(waiting_id)
+                if quest:
+                    self._track_unlock(quest)
+
+    def _release_for_level(self, level: int):
+        """Move quests whose level requirement is now met into the ready bucket."""
+        if level < self._unlocked_level:
+            # Levels only rise during play; a lower one means a different
+            # character, so start the tracking over
+            self._rebuild_unlock_index()
+        self._unlocked_level = level
+
+        heap = self._blocked_by_level
+        released = False
+        while heap and heap[0][0] <= level:
+            _, _, quest_id = heapq.heappop(heap)
+            quest = self.available_quests.get(quest_id)
+            if quest:
+                self._ready[quest_id] = quest
+                released = True
+
+        if released:
+            # Keep quests listed in the order they were registered
+            ordinals = self._ordinals
+            self._ready = dict(sorted(self._ready.items(), key=lambda kv: ordinals[kv[0]]))
 
     def get_quest(self, quest_id: str) -> Optional[Quest]:
         """Get a quest by ID from any category."""
@@ -222,7 +459,7 @@ class QuestManager:
         if not quest:
             return False, "Quest not found."
 
-        return quest.can_start(character, self.completed_quests)
+        return quest.can_start(character, self.completed_quests, self.completed_mask)
 
     def start_quest(self, quest_id: str) -> bool:
         """Start a quest."""
@@ -233,13 +470,59 @@ class QuestManager:
         quest.start()
         self.active_quests[quest_id] = quest
         del self.available_quests[quest_id]
+        self._ready.pop(quest_id, None)
+        self._active_dirty = True
+        for key in quest.objective_keys():
+            self._active_by_key.setdefault(key, []).append(quest)
         return True
 
     def update_quest_progress(self, objective_type: ObjectiveType, target: str, amount: int = 1):
         """Update progress for all relevant active quests."""
-        for quest in self.active_quests.values():
+        pending = self._pending_events
+        if pending is not None:
+            pending.append((objective_type, target, amount))
+            return
+
+        for quest in self._active_by_key.get((objective_type, target), ()):
             quest.update_objective(objective_type, target, amount)
 
+    def update_quest_progress_batch(self, events: List[Tuple[ObjectiveType, str, int]]):
+        """
+        Apply many (objective_type, target, amount) events at once.
+        Amounts for the same type and target are summed and dispatched once.
+        """
+        totals: Dict[Tuple[ObjectiveType, str], int] = {}
+        for objective_type, target, amount in events:
+            key = (objective_type, target)
+            totals[key] = totals.get(key, 0) + amount
+
+        active_by_key = self._active_by_key
+        for key, amount in totals.items():
+            objective_type, target = key
+            for quest in active_by_key.get(key, ()):
+                quest.update_objective(objective_type, target, amount)
+
+    @contextmanager
+    def batch_events(self):
+        """
+        Queue update_quest_progress calls and apply them together on exit.
+
+        Usage:
+            with quest_manager.batch_events():
+                ...  # e.g. a combat round recording several kills
+        """
+        if self._pending_events is not None:
+            # Already batching; the outer block flushes
+            yield
+            return
+
+        self._pending_events = []
+        try:
+            yield
+        finally:
+            events, self._pending_events = self._pending_events, None
+            self.update_quest_progress_batch(events)
+
     def complete_quest(self, quest_id: str) -> Optional[Quest]:
         """
         Complete a quest and move it to completed.
@@ -251,14 +534,27 @@ class QuestManager:
         quest = self.active_quests[quest_id]
         if quest.complete():
             self.completed_quests.add(quest_id)
+            self.completed_mask |= 1 << self._ordinal(quest_id)
             del self.active_quests[quest_id]
+            self._release_prerequisite(quest_id)
+            self._active_dirty = True
+            # Quests put in active_quests directly never joined the index
+            active_by_key = self._active_by_key
+            for key in quest.objective_keys():
+                listeners = active_by_key.get(key)
+                if listeners is None or quest not in listeners:
+                    continue
+                listeners.remove(quest)
+                if not listeners:
+                    del active_by_key[key]
             return quest
 
         return None
 
     def get_completable_quests(self) -> List[Quest]:
         """Get all active quests that can be completed."""
-        return [q for q in self.active_quests.values() if q.check_completion()]
+        check = Quest.check_completion
+        return [q for q in self.active_quests.values() if check(q)]
 
     def get_active_quests(self) -> List[Quest]:
         """Get all active quests."""
@@ -266,267 +562,203 @@ class QuestManager:
 
     def get_available_quests(self, character) -> List[Quest]:
         """Get all quests that can be started."""
-        available = []
-        for quest in self.available_quests.values():
-            can_start, _ = quest.can_start(character, self.completed_quests)
-            if can_start:
-                available.append(quest)
-        return available
+        self._release_for_level(character.level)
+        return list(self._ready.values())
 
     def display_active_quests(self) -> str:
-        """Display all active quests."""
+        """
+        Display all active quests.
+        The text is cached until a quest or one of its objectives changes
+        through its own methods.
+        """
+        if not self._active_dirty and self._active_display_cache is not None:
+            return self._active_display_cache
+
+        self._active_display_cache = self._render_active_quests()
+        self._active_dirty = False
+        return self._active_display_cache
+
+    def _render_active_quests(self) -> str:
+        """Build the active quest listing."""
         if not self.active_quests:
             return "\nNo active quests.\n"
 
-        output = []
-        output.append("\n=== ACTIVE QUESTS ===\n")
+        output = ["\n=== ACTIVE QUESTS ===\n"]
+        append = output.append
+        check = Quest.check_completion
+        progress = Objective.get_progress_string
 
         for quest in self.active_quests.values():
-            completable = "✓" if quest.check_completion() else "○"
-            output.append(f"{completable} {quest.name}")
-
+            append(("✓ " if check(quest) else "○ ") + quest.name)
             for obj in quest.objectives:
-                output.append(f"    {obj.get_progress_string()}")
+                append("    " + progress(obj))
 
         return '\n'.join(output)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for saving."""
-        active_data = {}
-        for quest_id, quest in self.active_quests.items():
-            active_data[quest_id] = quest.to_dict()
-
-        available_data = {}
-        for quest_id, quest in self.available_quests.items():
-            available_data[quest_id] = quest.to_dict()
-
         return {
-            'active_quests': active_data,
-            'available_quests': available_data,
+            'active_quests': {qid: q.to_dict() for qid, q in self.active_quests.items()},
+            'available_quests': {qid: q.to_dict() for qid, q in self.available_quests.items()},
             'completed_quests': list(self.completed_quests)
         }
 
     def from_dict(self, data: Dict):
-        """Load from dictionary."""
+        """
+        Load from dictionary.
+        Quests are rebuilt from the registered templates with the saved
+        progress applied on top.
+        """
         self.completed_quests = set(data.get('completed_quests', []))
+        self.completed_mask = 0
+        for quest_id in self.completed_quests:
+            self.completed_mask |= 1 << self._ordinal(quest_id)
 
-        # Active quests need to be reconstructed from templates
-        # This would require access to quest templates
-        # For now, just track the IDs and status
+        self.active_quests = {}
+        self.available_quests = {}
+        self._active_by_key = {}
+
+        for quest_id, quest_data in data.get('active_quests', {}).items():
+            template = self._templates.get(quest_id)
+            if template is None:
+                continue
+            quest = copy.copy(template)
+            quest.from_dict(quest_data)
+            self.active_quests[quest_id] = quest
+            for key in quest.objective_keys():
+                self._active_by_key.setdefault(key, []).append(quest)
+
+        for quest_id, template in self._templates.items():
+            if quest_id not in self.active_quests and quest_id not in self.completed_quests:
+                self.available_quests[quest_id] = copy.copy(template)
+
+        self._rebuild_unlock_index()
+        self._active_dirty = True
 
 
 # =============================================================================
 # QUEST DEFINITIONS
 # =============================================================================
 
-def create_all_quests() -> QuestManager:
-    """Create and register all quests in the game."""
-    manager = QuestManager()
-
+# Each row: (quest_id, name, description,
+#            ((objective_id, description, objective_type, target, amount), ...),
+#            level_requirement, xp_reward, gold_reward, item_rewards, prerequisite_quests)
+QUEST_TABLE = (
     # === STARTER QUESTS ===
 
-    manager.register_quest(Quest(
-        "first_steps", "First Steps",
-        "The village elder asks you to prove yourself by defeating some slimes in the meadow.",
-        objectives=[
-            Objective("kill_slimes", "Defeat 3 Slimes", ObjectiveType.KILL_ENEMY, "slime", 3)
-        ],
-        level_requirement=1,
-        xp_reward=50,
-        gold_reward=25,
-        item_rewards=["health_potion_small", "health_potion_small"]
-    ))
-
-    manager.register_quest(Quest(
-        "wolf_problem", "Wolf Problem",
-        "Wolves have been attacking travelers on the forest path. Help clear them out.",
-        objectives=[
-            Objective("kill_wolves", "Defeat 5 Wolves", ObjectiveType.KILL_ENEMY, "wolf", 5)
-        ],
-        level_requirement=2,
-        xp_reward=100,
-        gold_reward=50,
-        item_rewards=["leather_armor"]
-    ))
-
-    manager.register_quest(Quest(
-        "goblin_threat", "The Goblin Threat",
-        "Goblins have established a camp near the forest. Defeat their chief to scatter them.",
-        objectives=[
-            Objective("kill_chief", "Defeat the Goblin Chief", ObjectiveType.KILL_ENEMY, "goblin_chief", 1),
-            Objective("collect_head", "Collect proof of victory", ObjectiveType.COLLECT_ITEM, "goblin_chief_head", 1)
-        ],
-        level_requirement=4,
-        xp_reward=200,
-        gold_reward=150,
-        item_rewards=["steel_sword", "health_potion_medium"],
-        prerequisite_quests=["first_steps"]
-    ))
+    ("first_steps", "First Steps",
+     "The village elder asks you to prove yourself by defeating some slimes in the meadow.",
+     (("kill_slimes", "Defeat 3 Slimes", ObjectiveType.KILL_ENEMY, "slime", 3),),
+     1, 50, 25,
+     ("health_potion_small", "health_potion_small"),
+     ()),
+    ("wolf_problem", "Wolf Problem",
+     "Wolves have been attacking travelers on the forest path. Help clear them out.",
+     (("kill_wolves", "Defeat 5 Wolves", ObjectiveType.KILL_ENEMY, "wolf", 5),),
+     2, 100, 50,
+     ("leather_armor",),
+     ()),
+    ("goblin_threat", "The Goblin Threat",
+     "Goblins have established a camp near the forest. Defeat their chief to scatter them.",
+     (("kill_chief", "Defeat the Goblin Chief", ObjectiveType.KILL_ENEMY, "goblin_chief", 1),
+      ("collect_head", "Collect proof of victory", ObjectiveType.COLLECT_ITEM, "goblin_chief_head", 1)),
+     4, 200, 150,
+     ("steel_sword", "health_potion_medium"),
+     ("first_steps",)),
 
     # === EXPLORATION QUESTS ===
 
-    manager.register_quest(Quest(
-        "explore_coast", "Coastal Explorer",
-        "Visit the port city and explore the coastal areas.",
-        objectives=[
-            Objective("visit_port", "Visit Port City", ObjectiveType.VISIT_LOCATION, "port_city", 1),
-            Objective("visit_beach", "Explore Beach Cave", ObjectiveType.VISIT_LOCATION, "beach_cave", 1)
-        ],
-        level_requirement=4,
-        xp_reward=150,
-        gold_reward=100,
-        item_rewards=["silver_amulet"]
-    ))
-
-    manager.register_quest(Quest(
-        "mountain_expedition", "Mountain Expedition",
-        "Reach the mountain village and survey the snowy peaks.",
-        objectives=[
-            Objective("visit_village", "Reach Mountain Village", ObjectiveType.VISIT_LOCATION, "mountain_village", 1),
-            Objective("visit_peaks", "Survey Snowy Peaks", ObjectiveType.VISIT_LOCATION, "snowy_peaks", 1)
-        ],
-        level_requirement=8,
-        xp_reward=300,
-        gold_reward=200,
-        item_rewards=["ring_haste", "health_potion_large"]
-    ))
+    ("explore_coast", "Coastal Explorer",
+     "Visit the port city and explore the coastal areas.",
+     (("visit_port", "Visit Port City", ObjectiveType.VISIT_LOCATION, "port_city", 1),
+      ("visit_beach", "Explore Beach Cave", ObjectiveType.VISIT_LOCATION, "beach_cave", 1)),
+     4, 150, 100,
+     ("silver_amulet",),
+     ()),
+    ("mountain_expedition", "Mountain Expedition",
+     "Reach the mountain village and survey the snowy peaks.",
+     (("visit_village", "Reach Mountain Village", ObjectiveType.VISIT_LOCATION, "mountain_village", 1),
+      ("visit_peaks", "Survey Snowy Peaks", ObjectiveType.VISIT_LOCATION, "snowy_peaks", 1)),
+     8, 300, 200,
+     ("ring_haste", "health_potion_large"),
+     ()),
 
     # === COLLECTION QUESTS ===
 
-    manager.register_quest(Quest(
-        "herb_gathering", "Herb Gathering",
-        "The village healer needs rare herbs. Search the witch's hut area.",
-        objectives=[
-            Objective("collect_herb", "Find Rare Healing Herb", ObjectiveType.COLLECT_ITEM, "rare_herb", 1)
-        ],
-        level_requirement=5,
-        xp_reward=120,
-        gold_reward=80,
-        item_rewards=["health_potion_large", "elixir_vitality"]
-    ))
-
-    manager.register_quest(Quest(
-        "crystal_collector", "Crystal Collector",
-        "A wizard needs enchanted crystals for research. Bring him 3 crystals.",
-        objectives=[
-            Objective("collect_crystals", "Collect Enchanted Crystals",
-                      ObjectiveType.COLLECT_ITEM, "enchanted_crystal", 3)
-        ],
-        level_requirement=7,
-        xp_reward=250,
-        gold_reward=200,
-        item_rewards=["staff_mage", "health_potion_supreme"]
-    ))
-
-    manager.register_quest(Quest(
-        "dragon_scales", "Dragon Scale Armor",
-        "A master blacksmith will craft legendary armor if you bring dragon scales.",
-        objectives=[
-            Objective("collect_scales", "Collect Dragon Scales",
-                      ObjectiveType.COLLECT_ITEM, "dragon_scale", 5)
-        ],
-        level_requirement=12,
-        xp_reward=500,
-        gold_reward=500,
-        item_rewards=["dragon_armor", "dragon_slayer"]
-    ))
+    ("herb_gathering", "Herb Gathering",
+     "The village healer needs rare herbs. Search the witch's hut area.",
+     (("collect_herb", "Find Rare Healing Herb", ObjectiveType.COLLECT_ITEM, "rare_herb", 1),),
+     5, 120, 80,
+     ("health_potion_large", "elixir_vitality"),
+     ()),
+    ("crystal_collector", "Crystal Collector",
+     "A wizard needs enchanted crystals for research. Bring him 3 crystals.",
+     (("collect_crystals", "Collect Enchanted Crystals", ObjectiveType.COLLECT_ITEM, "enchanted_crystal", 3),),
+     7, 250, 200,
+     ("staff_mage", "health_potion_supreme"),
+     ()),
+    ("dragon_scales", "Dragon Scale Armor",
+     "A master blacksmith will craft legendary armor if you bring dragon scales.",
+     (("collect_scales", "Collect Dragon Scales", ObjectiveType.COLLECT_ITEM, "dragon_scale", 5),),
+     12, 500, 500,
+     ("dragon_armor", "dragon_slayer"),
+     ()),
 
     # === COMBAT QUESTS ===
 
-    manager.register_quest(Quest(
-        "skeleton_slayer", "Skeleton Slayer",
-        "Undead skeletons have been spotted near the ruins. Clear them out.",
-        objectives=[
-            Objective("kill_skeletons", "Defeat 8 Skeleton Warriors",
-                      ObjectiveType.KILL_ENEMY, "skeleton", 8)
-        ],
-        level_requirement=5,
-        xp_reward=180,
-        gold_reward=120,
-        item_rewards=["silver_rapier", "chain_mail"]
-    ))
-
-    manager.register_quest(Quest(
-        "vampire_hunter", "Vampire Hunter",
-        "A vampire lord has been terrorizing travelers. Hunt it down.",
-        objectives=[
-            Objective("kill_vampire", "Defeat the Vampire Lord",
-                      ObjectiveType.KILL_ENEMY, "vampire", 1)
-        ],
-        level_requirement=10,
-        xp_reward=400,
-        gold_reward=300,
-        item_rewards=["amulet_protection", "phoenix_down"]
-    ))
-
-    manager.register_quest(Quest(
-        "demon_bane", "Demon Bane",
-        "Lesser demons have emerged from the underworld. Send them back!",
-        objectives=[
-            Objective("kill_demons", "Defeat 5 Lesser Demons",
-                      ObjectiveType.KILL_ENEMY, "demon", 5)
-        ],
-        level_requirement=12,
-        xp_reward=600,
-        gold_reward=400,
-        item_rewards=["ring_strength", "crown_wisdom", "health_potion_supreme"]
-    ))
+    ("skeleton_slayer", "Skeleton Slayer",
+     "Undead skeletons have been spotted near the ruins. Clear them out.",
+     (("kill_skeletons", "Defeat 8 Skeleton Warriors", ObjectiveType.KILL_ENEMY, "skeleton", 8),),
+     5, 180, 120,
+     ("silver_rapier", "chain_mail"),
+     ()),
+    ("vampire_hunter", "Vampire Hunter",
+     "A vampire lord has been terrorizing travelers. Hunt it down.",
+     (("kill_vampire", "Defeat the Vampire Lord", ObjectiveType.KILL_ENEMY, "vampire", 1),),
+     10, 400, 300,
+     ("amulet_protection", "phoenix_down"),
+     ()),
+    ("demon_bane", "Demon Bane",
+     "Lesser demons have emerged from the underworld. Send them back!",
+     (("kill_demons", "Defeat 5 Lesser Demons", ObjectiveType.KILL_ENEMY, "demon", 5),),
+     12, 600, 400,
+     ("ring_strength", "crown_wisdom", "health_potion_supreme"),
+     ()),
 
     # === BOSS QUESTS ===
 
-    manager.register_quest(Quest(
-        "dragon_slayer_quest", "Dragon Slayer",
-        "An ancient dragon threatens the realm. Only a true hero can defeat it.",
-        objectives=[
-            Objective("kill_dragon", "Defeat the Ancient Dragon",
-                      ObjectiveType.KILL_ENEMY, "dragon", 1)
-        ],
-        level_requirement=15,
-        xp_reward=1000,
-        gold_reward=1000,
-        item_rewards=["excalibur", "dragon_armor", "phoenix_down", "elixir_vitality"],
-        prerequisite_quests=["demon_bane", "vampire_hunter"]
-    ))
-
-    manager.register_quest(Quest(
-        "lich_king", "The Lich King",
-        "The ultimate evil - defeat the Lich King and save the world!",
-        objectives=[
-            Objective("kill_lich", "Defeat the Lich King",
-                      ObjectiveType.KILL_ENEMY, "lich", 1)
-        ],
-        level_requirement=18,
-        xp_reward=2000,
-        gold_reward=2000,
-        item_rewards=["celestial_robe", "pendant_phoenix", "star_fragment"],
-        prerequisite_quests=["dragon_slayer_quest"]
-    ))
+    ("dragon_slayer_quest", "Dragon Slayer",
+     "An ancient dragon threatens the realm. Only a true hero can defeat it.",
+     (("kill_dragon", "Defeat the Ancient Dragon", ObjectiveType.KILL_ENEMY, "dragon", 1),),
+     15, 1000, 1000,
+     ("excalibur", "dragon_armor", "phoenix_down", "elixir_vitality"),
+     ("demon_bane", "vampire_hunter")),
+    ("lich_king", "The Lich King",
+     "The ultimate evil - defeat the Lich King and save the world!",
+     (("kill_lich", "Defeat the Lich King", ObjectiveType.KILL_ENEMY, "lich", 1),),
+     18, 2000, 2000,
+     ("celestial_robe", "pendant_phoenix", "star_fragment"),
+     ("dragon_slayer_quest",)),
 
     # === LEVEL PROGRESSION QUESTS ===
 
-    manager.register_quest(Quest(
-        "prove_strength", "Prove Your Strength",
-        "Train and reach level 5 to prove you're ready for greater challenges.",
-        objectives=[
-            Objective("reach_level", "Reach Level 5", ObjectiveType.REACH_LEVEL, "5", 5)
-        ],
-        level_requirement=1,
-        xp_reward=100,
-        gold_reward=100,
-        item_rewards=["health_potion_medium", "iron_sword"]
-    ))
-
-    manager.register_quest(Quest(
-        "master_warrior", "Master Warrior",
-        "Become a master warrior by reaching level 10.",
-        objectives=[
-            Objective("reach_level", "Reach Level 10", ObjectiveType.REACH_LEVEL, "10", 10)
-        ],
-        level_requirement=5,
-        xp_reward=300,
-        gold_reward=300,
-        item_rewards=["plate_armor", "health_potion_large", "phoenix_down"],
-        prerequisite_quests=["prove_strength"]
-    ))
+    ("prove_strength", "Prove Your Strength",
+     "Train and reach level 5 to prove you're ready for greater challenges.",
+     (("reach_level", "Reach Level 5", ObjectiveType.REACH_LEVEL, "5", 5),),
+     1, 100, 100,
+     ("health_potion_medium", "iron_sword"),
+     ()),
+    ("master_warrior", "Master Warrior",
+     "Become a master warrior by reaching level 10.",
+     (("reach_level", "Reach Level 10", ObjectiveType.REACH_LEVEL, "10", 10),),
+     5, 300, 300,
+     ("plate_armor", "health_potion_large", "phoenix_down"),
+     ("prove_strength",)),
+)
+
 
+def create_all_quests() -> QuestManager:
+    """Create and register all quests in the game."""
+    manager = QuestManager()
+    manager.bulk_register(QUEST_TABLE)
     return manager
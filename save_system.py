@@ -3,9 +3,90 @@ Save System module - Handles game saving and loading.
 """
 
 import json
+import mmap
 import os
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+
+from character import Character
+from inventory import Inventory
+from world import create_game_world
+from quest import create_all_quests
+from crafting import create_crafting_system
+from items import create_item
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; saves use the standard json module without it
+    orjson = None
+
+
+# get_all_saves results per save directory, keyed on the directory's mtime
+_saves_cache: Dict[str, Tuple[int, List[Dict]]] = {}
+
+# Small file written next to each save holding what the save list shows.
+# It doesn't end in .json, so it can never be mistaken for a save itself.
+META_SUFFIX = ".json.meta"
+
+
+def _encode_default(obj):
+    """
+    Encode values JSON has no type for. Game objects are saved through
+    their to_dict() as the encoder reaches them; sets become sorted lists.
+    """
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Encode save data as JSON bytes, indented if pretty is set."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_encode_default,
+                            option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2, default=_encode_default).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'),
+                      default=_encode_default).encode('utf-8')
+
+
+def _write_atomic(path: str, payload: bytes):
+    """Write payload to path so readers see the old file or the new one, never half."""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _loads(data: bytes):
+    """Decode JSON save data."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Files smaller than this are read normally; mapping them costs more than it saves
+_MMAP_THRESHOLD = 4096
+
+
+def _load_file(path: str):
+    """Decode a JSON file, memory-mapping large files when orjson can parse the map."""
+    with open(path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return _loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
 
 
 class SaveGame:
@@ -18,9 +99,10 @@ class SaveGame:
         self.timestamp = datetime.now()
         self.data = {}
 
-    def save_to_file(self, save_dir: str = "saves") -> bool:
+    def save_to_file(self, save_dir: str = "saves", pretty: bool = False) -> bool:
         """
         Save game data to file.
+        Set pretty to write indented JSON for debugging.
         Returns True if successful.
         """
         try:
@@ -34,10 +116,29 @@ class SaveGame:
                 'data': self.data
             }
 
-            # Write to file
+            # Encode in one pass and write once
+            payload = _dumps(save_data, pretty)
             filename = os.path.join(save_dir, f"{self.save_name}.json")
-            with open(filename, 'w') as f:
-                json.dump(save_data, f, indent=2)
+            _write_atomic(filename, payload)
+
+            # Write the listing metadata so get_all_saves can skip the full file
+            character = self.data.get('character') or {}
+            if isinstance(character, dict):
+                character_name = character.get('name', 'Unknown')
+                level = character.get('level', 0)
+            else:
+                character_name, level = character.name, character.level
+            meta = {
+                'save_name': self.save_name,
+                'timestamp': save_data['timestamp'],
+                'character_name': character_name,
+                'level': level
+            }
+            meta_filename = os.path.join(save_dir, f"{self.save_name}{META_SUFFIX}")
+            _write_atomic(meta_filename, _dumps(meta, pretty))
+
+            # Don't rely on the directory mtime alone; it can be coarse
+            _saves_cache.pop(save_dir, None)
 
             return True
 
@@ -57,8 +158,7 @@ class SaveGame:
             if not os.path.exists(filename):
                 return None
 
-            with open(filename, 'r') as f:
-                save_data = json.load(f)
+            save_data = _load_file(filename)
 
             save_game = SaveGame(save_data['save_name'])
             save_game.timestamp = datetime.fromisoformat(save_data['timestamp'])
@@ -82,21 +182,46 @@ class SaveGame:
             if not os.path.exists(save_dir):
                 return saves
 
-            for filename in os.listdir(save_dir):
-                if filename.endswith('.json'):
-                    save_name = filename[:-5]  # Remove .json extension
-
-                    # Try to load metadata
-                    filepath = os.path.join(save_dir, filename)
-                    with open(filepath, 'r') as f:
-                        save_data = json.load(f)
-
-                    saves.append({
-                        'save_name': save_name,
-                        'timestamp': save_data.get('timestamp', 'Unknown'),
-                        'character_name': save_data.get('data', {}).get('character', {}).get('name', 'Unknown'),
-                        'level': save_data.get('data', {}).get('character', {}).get('level', 0)
-                    })
+            mtime = os.stat(save_dir).st_mtime_ns
+            cached = _saves_cache.get(save_dir)
+            if cached and cached[0] == mtime:
+                return list(cached[1])
+
+            save_files = []
+            meta_files = {}
+            with os.scandir(save_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith('.json'):
+                        if entry.is_file(follow_symlinks=False):
+                            # Remove .json extension
+                            save_files.append((name[:-5], entry.path, entry.stat().st_mtime_ns))
+                    elif name.endswith(META_SUFFIX):
+                        if entry.is_file(follow_symlinks=False):
+                            meta_files[name[:-len(META_SUFFIX)]] = (entry.path,
+                                                                    entry.stat().st_mtime_ns)
+
+            for save_name, path, save_mtime in save_files:
+                meta_entry = meta_files.get(save_name)
+                # A metadata file older than its save is stale: the save was
+                # edited by hand, or writing the metadata was interrupted
+                if meta_entry and meta_entry[1] >= save_mtime:
+                    meta = _load_file(meta_entry[0])
+                    meta['save_name'] = save_name
+                    saves.append(meta)
+                    continue
+
+                # No usable metadata file: read the full save
+                save_data = _load_file(path)
+
+                saves.append({
+                    'save_name': save_name,
+                    'timestamp': save_data.get('timestamp', 'Unknown'),
+                    'character_name': save_data.get('data', {}).get('character', {}).get('name', 'Unknown'),
+                    'level': save_data.get('data', {}).get('character', {}).get('level', 0)
+                })
+
+            _saves_cache[save_dir] = (mtime, list(saves))
 
         except Exception as e:
             print(f"Error listing saves: {e}")
@@ -114,6 +239,10 @@ class SaveGame:
 
             if os.path.exists(filename):
                 os.remove(filename)
+                meta_filename = os.path.join(save_dir, f"{save_name}{META_SUFFIX}")
+                if os.path.exists(meta_filename):
+                    os.remove(meta_filename)
+                _saves_cache.pop(save_dir, None)
                 return True
 
             return False
@@ -143,13 +272,14 @@ class GameState:
         try:
             save_game = SaveGame(save_name)
 
-            # Gather all game data
+            # Hand over the objects themselves; the encoder calls to_dict()
+            # on each as it writes, so no full copy of the state is built first
             save_game.data = {
-                'character': self.character.to_dict() if self.character else None,
-                'inventory': self.inventory.to_dict() if self.inventory else None,
-                'world': self.world.to_dict() if self.world else None,
-                'quests': self.quest_manager.to_dict() if self.quest_manager else None,
-                'crafting': self.crafting_system.to_dict() if self.crafting_system else None
+                'character': self.character,
+                'inventory': self.inventory,
+                'world': self.world,
+                'quests': self.quest_manager,
+                'crafting': self.crafting_system
             }
 
             return save_game.save_to_file()
@@ -173,29 +303,24 @@ class GameState:
 
             # Load character
             if 'character' in data and data['character']:
-                from character import Character
                 self.character = Character.from_dict(data['character'])
 
             # Load inventory
             if 'inventory' in data and data['inventory']:
-                from inventory import Inventory
                 self.inventory = Inventory.from_dict(data['inventory'])
 
             # Load world
             if 'world' in data and data['world']:
-                from world import create_game_world
                 self.world = create_game_world()
                 self.world.from_dict(data['world'])
 
             # Load quest manager
             if 'quests' in data and data['quests']:
-                from quest import create_all_quests
                 self.quest_manager = create_all_quests()
                 self.quest_manager.from_dict(data['quests'])
 
             # Load crafting system
             if 'crafting' in data and data['crafting']:
-                from crafting import create_crafting_system
                 self.crafting_system = create_crafting_system()
                 self.crafting_system.from_dict(data['crafting'])
 
@@ -204,12 +329,15 @@ class GameState:
                 char_data = data['character']
                 equipped = char_data.get('equipped', {})
 
-                for slot, item_data in equipped.items():
-                    if item_data:
-                        from items import create_item
-                        item = create_item(item_data['item_id'])
-                        if item:
-                            self.character.equip_item(item, slot)
+                items = [(slot, create_item(d['item_id']))
+                         for slot, d in equipped.items() if d]
+
+                # Bonuses were already restored by Character.from_dict, so
+                # fill the slots directly instead of re-applying them
+                slots = self.character.equipped
+                for slot, item in items:
+                    if item and slot in slots:
+                        slots[slot] = item
 
             return True
 
@@ -219,13 +347,6 @@ class GameState:
 
     def new_game(self, character_name: str):
         """Initialize a new game."""
-        from character import Character
-        from inventory import Inventory
-        from world import create_game_world
-        from quest import create_all_quests
-        from crafting import create_crafting_system
-        from items import create_item
-
         self.character = Character(character_name)
         self.inventory = Inventory()
         self.world = create_game_world()
@@ -2,9 +2,37 @@
 Statistics module - Tracks detailed player statistics and records.
 """
 
+import time
 from typing import Dict, List
 from datetime import datetime, timedelta
-from collections import defaultdict
+
+
+_RULE = "=" * 70
+
+# Attributes saved under their own name with no conversion
+_PLAIN_FIELDS = (
+    # Combat
+    'total_battles', 'battles_won', 'battles_fled', 'total_damage_dealt',
+    'total_damage_taken', 'critical_hits', 'dodges', 'deaths',
+    'flawless_victories', 'consecutive_wins', 'best_win_streak',
+    # Exploration
+    'treasures_found', 'distance_traveled', 'random_encounters',
+    # Economy
+    'total_gold_earned', 'total_gold_spent', 'items_bought', 'items_sold',
+    'most_expensive_purchase',
+    # Collection
+    'unique_items_owned', 'items_crafted', 'recipes_discovered',
+    # Progression
+    'quests_completed', 'quests_failed', 'total_xp_earned',
+    'highest_level_reached', 'stat_points_allocated',
+    # Time
+    'saves_created', 'loads_performed',
+    # Records
+    'highest_damage_single_hit', 'fastest_battle_victory', 'longest_battle',
+    'highest_gold_owned', 'most_items_inventory',
+    # Achievements
+    'achievements_unlocked'
+)
 
 
 class GameStatistics:
@@ -12,6 +40,12 @@ class GameStatistics:
     Tracks comprehensive game statistics.
     """
 
+    __slots__ = _PLAIN_FIELDS + (
+        'kills_by_enemy_type', 'locations_visited', 'items_collected',
+        '_game_start_time', '_game_start_text', '_accumulated_ns',
+        '_session_start_ns'
+    )
+
     def __init__(self):
         # Combat stats
         self.total_battles = 0
@@ -21,7 +55,7 @@ class GameStatistics:
         self.total_damage_taken = 0
         self.critical_hits = 0
         self.dodges = 0
-        self.kills_by_enemy_type = defaultdict(int)
+        self.kills_by_enemy_type: Dict[str, int] = {}
         self.deaths = 0
         self.flawless_victories = 0
         self.consecutive_wins = 0
@@ -55,8 +89,8 @@ class GameStatistics:
 
         # Time stats
         self.game_start_time = datetime.now()
-        self.total_play_time = timedelta(0)
-        self.session_start_time = datetime.now()
+        self._accumulated_ns = 0  # Play time, on the monotonic clock
+        self._session_start_ns = time.monotonic_ns()
         self.saves_created = 0
         self.loads_performed = 0
 
@@ -84,14 +118,18 @@ class GameStatistics:
         if flawless:
             self.flawless_victories += 1
 
-        self.consecutive_wins += 1
-        self.best_win_streak = max(self.best_win_streak, self.consecutive_wins)
+        streak = self.consecutive_wins + 1
+        self.consecutive_wins = streak
+        if streak > self.best_win_streak:
+            self.best_win_streak = streak
 
         # Update records
-        if self.fastest_battle_victory is None or turns < self.fastest_battle_victory:
+        fastest = self.fastest_battle_victory
+        if fastest is None or turns < fastest:
             self.fastest_battle_victory = turns
 
-        if self.longest_battle is None or turns > self.longest_battle:
+        longest = self.longest_battle
+        if longest is None or turns > longest:
             self.longest_battle = turns
 
     def record_battle_defeat(self):
@@ -106,11 +144,13 @@ class GameStatistics:
 
     def record_enemy_killed(self, enemy_type: str):
         """Record enemy kill."""
-        self.kills_by_enemy_type[enemy_type] += 1
+        kills = self.kills_by_enemy_type
+        kills[enemy_type] = kills.get(enemy_type, 0) + 1
 
     def record_damage_dealt(self, damage: int):
         """Record damage dealt."""
-        self.highest_damage_single_hit = max(self.highest_damage_single_hit, damage)
+        if damage > self.highest_damage_single_hit:
+            self.highest_damage_single_hit = damage
 
     def record_critical_hit(self):
         """Record critical hit."""
@@ -122,8 +162,7 @@ class GameStatistics:
 
     def record_location_visit(self, location_id: str):
         """Record location visit."""
-        if location_id not in self.locations_visited:
-            self.locations_visited.add(location_id)
+        self.locations_visited.add(location_id)
 
     def record_travel(self):
         """Record travel between locations."""
@@ -144,7 +183,8 @@ class GameStatistics:
     def record_gold_spent(self, amount: int):
         """Record gold spent."""
         self.total_gold_spent += amount
-        self.most_expensive_purchase = max(self.most_expensive_purchase, amount)
+        if amount > self.most_expensive_purchase:
+            self.most_expensive_purchase = amount
 
     def record_item_bought(self):
         """Record item purchase."""
@@ -156,8 +196,11 @@ class GameStatistics:
 
     def record_item_collected(self, item_id: str):
         """Record item collected."""
-        self.items_collected.add(item_id)
-        self.unique_items_owned = len(self.items_collected)
+        collected = self.items_collected
+        before = len(collected)
+        collected.add(item_id)
+        if len(collected) != before:
+            self.unique_items_owned += 1
 
     def record_item_crafted(self):
         """Record item crafted."""
@@ -181,7 +224,8 @@ class GameStatistics:
 
     def record_level_reached(self, level: int):
         """Record level reached."""
-        self.highest_level_reached = max(self.highest_level_reached, level)
+        if level > self.highest_level_reached:
+            self.highest_level_reached = level
 
     def record_stat_allocated(self):
         """Record stat point allocation."""
@@ -201,17 +245,39 @@ class GameStatistics:
 
     def update_gold_record(self, current_gold: int):
         """Update gold record."""
-        self.highest_gold_owned = max(self.highest_gold_owned, current_gold)
+        if current_gold > self.highest_gold_owned:
+            self.highest_gold_owned = current_gold
 
     def update_inventory_record(self, current_items: int):
         """Update inventory record."""
-        self.most_items_inventory = max(self.most_items_inventory, current_items)
+        if current_items > self.most_items_inventory:
+            self.most_items_inventory = current_items
 
     def update_session_time(self):
         """Update play time."""
-        session_duration = datetime.now() - self.session_start_time
-        self.total_play_time += session_duration
-        self.session_start_time = datetime.now()
+        now = time.monotonic_ns()
+        self._accumulated_ns += now - self._session_start_ns
+        self._session_start_ns = now
+
+    @property
+    def game_start_time(self) -> datetime:
+        """When this game was started."""
+        return self._game_start_time
+
+    @game_start_time.setter
+    def game_start_time(self, value: datetime):
+        # Formatted on first display, then kept; most instances never show it
+        self._game_start_time = value
+        self._game_start_text = None
+
+    @property
+    def total_play_time(self) -> timedelta:
+        """Total play time up to the last update."""
+        return timedelta(microseconds=self._accumulated_ns // 1000)
+
+    @total_play_time.setter
+    def total_play_time(self, value: timedelta):
+        self._accumulated_ns = (value // timedelta(microseconds=1)) * 1000
 
     def get_win_rate(self) -> float:
         """Calculate win rate percentage."""
@@ -241,82 +307,79 @@ class GameStatistics:
 
     def display_statistics(self) -> str:
         """Display formatted statistics."""
-        output = []
-        output.append("\n" + "="*70)
-        output.append("GAME STATISTICS")
-        output.append("="*70)
-
-        # Combat Statistics
-        output.append("\n[COMBAT]")
-        output.append(f"  Total Battles: {self.total_battles}")
-        output.append(f"  Victories: {self.battles_won} | Defeats: {self.deaths} | "
-                      f"Fled: {self.battles_fled}")
-        output.append(f"  Win Rate: {self.get_win_rate():.1f}%")
-        output.append(f"  Flawless Victories: {self.flawless_victories}")
-        output.append(f"  Best Win Streak: {self.best_win_streak}")
-        output.append(f"  Total Damage Dealt: {self.total_damage_dealt}")
-        output.append(f"  Total Damage Taken: {self.total_damage_taken}")
-        output.append(f"  Average Damage/Battle: {self.get_average_damage_per_battle():.1f}")
-        output.append(f"  Critical Hits: {self.critical_hits}")
-        output.append(f"  Successful Dodges: {self.dodges}")
-        output.append(f"  Highest Damage (Single Hit): {self.highest_damage_single_hit}")
+        started = self._game_start_text
+        if started is None:
+            started = self._game_start_time.isoformat(sep=' ', timespec='minutes')
+            self._game_start_text = started
 
+        # Optional lines, each carrying its own leading newline
+        records = ""
         if self.fastest_battle_victory:
-            output.append(f"  Fastest Victory: {self.fastest_battle_victory} turns")
-
-        # Top enemies killed
+            records += f"\n  Fastest Victory: {self.fastest_battle_victory} turns"
         if self.kills_by_enemy_type:
             top_kills = sorted(self.kills_by_enemy_type.items(),
                                key=lambda x: x[1], reverse=True)[:3]
-            output.append(f"  Most Killed:")
-            for enemy, count in top_kills:
-                output.append(f"    • {enemy}: {count}")
-
-        # Exploration Statistics
-        output.append("\n[EXPLORATION]")
-        output.append(f"  Locations Discovered: {len(self.locations_visited)}")
-        output.append(f"  Distance Traveled: {self.distance_traveled} transitions")
-        output.append(f"  Treasures Found: {self.treasures_found}")
-        output.append(f"  Random Encounters: {self.random_encounters}")
-
-        # Economy Statistics
-        output.append("\n[ECONOMY]")
-        output.append(f"  Gold Earned: {self.total_gold_earned}g")
-        output.append(f"  Gold Spent: {self.total_gold_spent}g")
-        output.append(f"  Net Gold: {self.total_gold_earned - self.total_gold_spent}g")
-        output.append(f"  Highest Gold Owned: {self.highest_gold_owned}g")
-        output.append(f"  Items Bought: {self.items_bought}")
-        output.append(f"  Items Sold: {self.items_sold}")
-        output.append(f"  Most Expensive Purchase: {self.most_expensive_purchase}g")
-
-        # Collection Statistics
-        output.append("\n[COLLECTION]")
-        output.append(f"  Unique Items Collected: {self.unique_items_owned}")
-        output.append(f"  Items Crafted: {self.items_crafted}")
-        output.append(f"  Recipes Discovered: {self.recipes_discovered}")
-        output.append(f"  Most Items in Inventory: {self.most_items_inventory}")
-
-        # Progression Statistics
-        output.append("\n[PROGRESSION]")
-        output.append(f"  Highest Level: {self.highest_level_reached}")
-        output.append(f"  Total XP Earned: {self.total_xp_earned}")
-        output.append(f"  Quests Completed: {self.quests_completed}")
-        output.append(f"  Quests Failed: {self.quests_failed}")
-        output.append(f"  Stat Points Allocated: {self.stat_points_allocated}")
-        output.append(f"  Achievements Unlocked: {self.achievements_unlocked}")
-
-        # Time Statistics
-        output.append("\n[TIME]")
+            records += "\n  Most Killed:" + "".join(
+                f"\n    • {enemy}: {count}" for enemy, count in top_kills)
+
         total_seconds = int(self.total_play_time.total_seconds())
         hours = total_seconds // 3600
         minutes = (total_seconds % 3600) // 60
-        output.append(f"  Total Play Time: {hours}h {minutes}m")
-        output.append(f"  Game Started: {self.game_start_time.strftime('%Y-%m-%d %H:%M')}")
-        output.append(f"  Saves Created: {self.saves_created}")
-        output.append(f"  Loads Performed: {self.loads_performed}")
 
-        output.append("\n" + "="*70)
-        return '\n'.join(output)
+        return f"""
+{_RULE}
+GAME STATISTICS
+{_RULE}
+
+[COMBAT]
+  Total Battles: {self.total_battles}
+  Victories: {self.battles_won} | Defeats: {self.deaths} | Fled: {self.battles_fled}
+  Win Rate: {self.get_win_rate():.1f}%
+  Flawless Victories: {self.flawless_victories}
+  Best Win Streak: {self.best_win_streak}
+  Total Damage Dealt: {self.total_damage_dealt}
+  Total Damage Taken: {self.total_damage_taken}
+  Average Damage/Battle: {self.get_average_damage_per_battle():.1f}
+  Critical Hits: {self.critical_hits}
+  Successful Dodges: {self.dodges}
+  Highest Damage (Single Hit): {self.highest_damage_single_hit}{records}
+
+[EXPLORATION]
+  Locations Discovered: {len(self.locations_visited)}
+  Distance Traveled: {self.distance_traveled} transitions
+  Treasures Found: {self.treasures_found}
+  Random Encounters: {self.random_encounters}
+
+[ECONOMY]
+  Gold Earned: {self.total_gold_earned}g
+  Gold Spent: {self.total_gold_spent}g
+  Net Gold: {self.total_gold_earned - self.total_gold_spent}g
+  Highest Gold Owned: {self.highest_gold_owned}g
+  Items Bought: {self.items_bought}
+  Items Sold: {self.items_sold}
+  Most Expensive Purchase: {self.most_expensive_purchase}g
+
+[COLLECTION]
+  Unique Items Collected: {self.unique_items_owned}
+  Items Crafted: {self.items_crafted}
+  Recipes Discovered: {self.recipes_discovered}
+  Most Items in Inventory: {self.most_items_inventory}
+
+[PROGRESSION]
+  Highest Level: {self.highest_level_reached}
+  Total XP Earned: {self.total_xp_earned}
+  Quests Completed: {self.quests_completed}
+  Quests Failed: {self.quests_failed}
+  Stat Points Allocated: {self.stat_points_allocated}
+  Achievements Unlocked: {self.achievements_unlocked}
+
+[TIME]
+  Total Play Time: {hours}h {minutes}m
+  Game Started: {started}
+  Saves Created: {self.saves_created}
+  Loads Performed: {self.loads_performed}
+
+{_RULE}"""
 
     def get_summary(self) -> str:
         """Get brief statistics summary."""
@@ -327,127 +390,31 @@ class GameStatistics:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for saving."""
-        return {
-            # Combat
-            'total_battles': self.total_battles,
-            'battles_won': self.battles_won,
-            'battles_fled': self.battles_fled,
-            'total_damage_dealt': self.total_damage_dealt,
-            'total_damage_taken': self.total_damage_taken,
-            'critical_hits': self.critical_hits,
-            'dodges': self.dodges,
-            'kills_by_enemy_type': dict(self.kills_by_enemy_type),
-            'deaths': self.deaths,
-            'flawless_victories': self.flawless_victories,
-            'consecutive_wins': self.consecutive_wins,
-            'best_win_streak': self.best_win_streak,
-
-            # Exploration
-            'locations_visited': list(self.locations_visited),
-            'treasures_found': self.treasures_found,
-            'distance_traveled': self.distance_traveled,
-            'random_encounters': self.random_encounters,
-
-            # Economy
-            'total_gold_earned': self.total_gold_earned,
-            'total_gold_spent': self.total_gold_spent,
-            'items_bought': self.items_bought,
-            'items_sold': self.items_sold,
-            'most_expensive_purchase': self.most_expensive_purchase,
-
-            # Collection
-            'items_collected': list(self.items_collected),
-            'unique_items_owned': self.unique_items_owned,
-            'items_crafted': self.items_crafted,
-            'recipes_discovered': self.recipes_discovered,
-
-            # Progression
-            'quests_completed': self.quests_completed,
-            'quests_failed': self.quests_failed,
-            'total_xp_earned': self.total_xp_earned,
-            'highest_level_reached': self.highest_level_reached,
-            'stat_points_allocated': self.stat_points_allocated,
-
-            # Time
-            'game_start_time': self.game_start_time.isoformat(),
-            'total_play_time_seconds': self.total_play_time.total_seconds(),
-            'saves_created': self.saves_created,
-            'loads_performed': self.loads_performed,
-
-            # Records
-            'highest_damage_single_hit': self.highest_damage_single_hit,
-            'fastest_battle_victory': self.fastest_battle_victory,
-            'longest_battle': self.longest_battle,
-            'highest_gold_owned': self.highest_gold_owned,
-            'most_items_inventory': self.most_items_inventory,
-
-            # Achievements
-            'achievements_unlocked': self.achievements_unlocked
-        }
+        data = {name: getattr(self, name) for name in _PLAIN_FIELDS}
+        data['kills_by_enemy_type'] = dict(self.kills_by_enemy_type)
+        data['locations_visited'] = sorted(self.locations_visited)
+        data['items_collected'] = sorted(self.items_collected)
+        data['game_start_time'] = self.game_start_time.isoformat()
+        data['total_play_time_seconds'] = self.total_play_time.total_seconds()
+        return data
 
     @staticmethod
     def from_dict(data: Dict) -> 'GameStatistics':
         """Create from dictionary."""
         stats = GameStatistics()
 
-        # Combat
-        stats.total_battles = data.get('total_battles', 0)
-        stats.battles_won = data.get('battles_won', 0)
-        stats.battles_fled = data.get('battles_fled', 0)
-        stats.total_damage_dealt = data.get('total_damage_dealt', 0)
-        stats.total_damage_taken = data.get('total_damage_taken', 0)
-        stats.critical_hits = data.get('critical_hits', 0)
-        stats.dodges = data.get('dodges', 0)
-        stats.kills_by_enemy_type = defaultdict(int, data.get('kills_by_enemy_type', {}))
-        stats.deaths = data.get('deaths', 0)
-        stats.flawless_victories = data.get('flawless_victories', 0)
-        stats.consecutive_wins = data.get('consecutive_wins', 0)
-        stats.best_win_streak = data.get('best_win_streak', 0)
-
-        # Exploration
+        for name in _PLAIN_FIELDS:
+            if name in data:
+                setattr(stats, name, data[name])
+
+        stats.kills_by_enemy_type = dict(data.get('kills_by_enemy_type', {}))
         stats.locations_visited = set(data.get('locations_visited', []))
-        stats.treasures_found = data.get('treasures_found', 0)
-        stats.distance_traveled = data.get('distance_traveled', 0)
-        stats.random_encounters = data.get('random_encounters', 0)
-
-        # Economy
-        stats.total_gold_earned = data.get('total_gold_earned', 0)
-        stats.total_gold_spent = data.get('total_gold_spent', 0)
-        stats.items_bought = data.get('items_bought', 0)
-        stats.items_sold = data.get('items_sold', 0)
-        stats.most_expensive_purchase = data.get('most_expensive_purchase', 0)
-
-        # Collection
         stats.items_collected = set(data.get('items_collected', []))
-        stats.unique_items_owned = data.get('unique_items_owned', 0)
-        stats.items_crafted = data.get('items_crafted', 0)
-        stats.recipes_discovered = data.get('recipes_discovered', 0)
-
-        # Progression
-        stats.quests_completed = data.get('quests_completed', 0)
-        stats.quests_failed = data.get('quests_failed', 0)
-        stats.total_xp_earned = data.get('total_xp_earned', 0)
-        stats.highest_level_reached = data.get('highest_level_reached', 1)
-        stats.stat_points_allocated = data.get('stat_points_allocated', 0)
-
-        # Time
+
         if 'game_start_time' in data:
             stats.game_start_time = datetime.fromisoformat(data['game_start_time'])
 
         if 'total_play_time_seconds' in data:
             stats.total_play_time = timedelta(seconds=data['total_play_time_seconds'])
 
-        stats.saves_created = data.get('saves_created', 0)
-        stats.loads_performed = data.get('loads_performed', 0)
-
-        # Records
-        stats.highest_damage_single_hit = data.get('highest_damage_single_hit', 0)
-        stats.fastest_battle_victory = data.get('fastest_battle_victory')
-        stats.longest_battle = data.get('longest_battle')
-        stats.highest_gold_owned = data.get('highest_gold_owned', 0)
-        stats.most_items_inventory = data.get('most_items_inventory', 0)
-
-        # Achievements
-        stats.achievements_unlocked = data.get('achievements_unlocked', 0)
-
         return stats
@@ -2,14 +2,31 @@
 UI module - User interface utilities and display functions.
 """
 
+import functools
 import os
+import sys
+import textwrap
 import time
 from typing import List, Optional, Callable
 
 
+def _animations_enabled() -> bool:
+    """Animate only on a terminal, and only if NO_ANIMATION is not set."""
+    return sys.stdout.isatty() and not os.environ.get('NO_ANIMATION')
+
+
+# Erase the display and move the cursor home
+_CLEAR_SEQ = "\x1b[2J\x1b[H"
+
+
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # The legacy Windows console has no ANSI support; Windows Terminal does
+    if os.name == 'nt' and not os.environ.get('WT_SESSION'):
+        os.system('cls')
+    else:
+        sys.stdout.write(_CLEAR_SEQ)
+        sys.stdout.flush()
 
 
 def print_separator(char: str = "=", length: int = 60):
@@ -26,11 +43,9 @@ def print_header(text: str, char: str = "=", length: int = 60):
 
 def print_box(lines: List[str], width: int = 60):
     """Print text in a box."""
-    print("┌" + "─" * (width - 2) + "┐")
-    for line in lines:
-        padding = width - len(line) - 4
-        print(f"│ {line}{' ' * padding} │")
-    print("└" + "─" * (width - 2) + "┘")
+    rule = "─" * (width - 2)
+    rows = [f"│ {line}{' ' * (width - len(line) - 4)} │" for line in lines]
+    print("\n".join(["┌" + rule + "┐", *rows, "└" + rule + "┘"]))
 
 
 def pause(message: str = "\nPress Enter to continue..."):
@@ -44,17 +59,21 @@ def get_choice(prompt: str, valid_choices: List[str],
     Get user choice from a list of valid options.
     Returns the selected choice.
     """
+    if not case_sensitive:
+        valid_choices = [c.lower() for c in valid_choices]
+    valid_set = frozenset(valid_choices)
+    options = ', '.join(valid_choices)
+
     while True:
         choice = input(prompt)
 
         if not case_sensitive:
             choice = choice.lower()
-            valid_choices = [c.lower() for c in valid_choices]
 
-        if choice in valid_choices:
+        if choice in valid_set:
             return choice
 
-        print(f"Invalid choice. Please choose from: {', '.join(valid_choices)}")
+        print(f"Invalid choice. Please choose from: {options}")
 
 
 def get_number(prompt: str, min_val: Optional[int] = None,
@@ -119,14 +138,38 @@ def display_menu(title: str, options: List[str], allow_back: bool = False) -> in
     return choice - 1
 
 
+# Characters written per flush by typewriter_print
+_TYPEWRITER_CHUNK = 4
+
+
 def typewriter_print(text: str, delay: float = 0.03):
-    """Print text with typewriter effect."""
-    for char in text:
-        print(char, end='', flush=True)
-        time.sleep(delay)
+    """
+    Print text with typewriter effect.
+    Set the FAST_UI environment variable to print it all at once.
+    """
+    if os.environ.get('FAST_UI') or not _animations_enabled():
+        print(text)
+        return
+
+    # Write a few characters per flush and sleep for all of them at once;
+    # the text appears at the same overall speed with far fewer writes
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    step = _TYPEWRITER_CHUNK
+    chunk_delay = delay * step
+    for i in range(0, len(text), step):
+        write(text[i:i + step])
+        flush()
+        time.sleep(chunk_delay)
     print()
 
 
+@functools.lru_cache(maxsize=256)
+def _stat_bar(fill_char: str, empty_char: str, width: int, filled: int) -> str:
+    """Build a bar; a given width has only width + 1 fill levels, so cache them."""
+    return fill_char * filled + empty_char * (width - filled)
+
+
 def print_stat_bar(label: str, current: int, maximum: int, width: int = 20,
                     fill_char: str = "█", empty_char: str = "░"):
     """
@@ -134,9 +177,8 @@ def print_stat_bar(label: str, current: int, maximum: int, width: int = 20,
     """
     percentage = current / maximum if maximum > 0 else 0
     filled = int(width * percentage)
-    empty = width - filled
 
-    bar = fill_char * filled + empty_char * empty
+    bar = _stat_bar(fill_char, empty_char, width, filled)
     print(f"{label}: [{bar}] {current}/{maximum}")
 
 
@@ -172,9 +214,8 @@ def display_level_up(character):
 
 def format_time(seconds: int) -> str:
     """Format seconds into readable time string."""
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
 
     if hours > 0:
         return f"{hours}h {minutes}m {secs}s"
@@ -184,10 +225,8 @@ def format_time(seconds: int) -> str:
         return f"{secs}s"
 
 
-def display_title_screen():
-    """Display the game title screen."""
-    clear_screen()
-    title = """
+# Full-screen art for the display_* functions below, dedented once here
+_TITLE_SCREEN = textwrap.dedent("""
     ╔═══════════════════════════════════════════════════════════╗
     ║                                                           ║
     ║        ███████╗██████╗ ██╗ ██████╗                       ║
@@ -207,14 +246,9 @@ def display_title_screen():
     ║              A Text-Based RPG Adventure                   ║
     ║                                                           ║
     ╚═══════════════════════════════════════════════════════════╝
-    """
-    print(title)
-
+    """)
 
-def display_game_over():
-    """Display game over screen."""
-    clear_screen()
-    print("""
+_GAME_OVER_SCREEN = textwrap.dedent("""
     ╔═══════════════════════════════════════════════════════════╗
     ║                                                           ║
     ║              ██████╗  █████╗ ███╗   ███╗███████╗         ║
@@ -236,11 +270,7 @@ def display_game_over():
     ╚═══════════════════════════════════════════════════════════╝
     """)
 
-
-def display_victory():
-    """Display victory screen."""
-    clear_screen()
-    print("""
+_VICTORY_SCREEN = textwrap.dedent("""
     ╔═══════════════════════════════════════════════════════════╗
     ║                                                           ║
     ║    ██╗   ██╗██╗ ██████╗████████╗ ██████╗ ██████╗ ██╗   ██╗
@@ -257,8 +287,50 @@ def display_victory():
     """)
 
 
+# The art pre-encoded for terminals that take UTF-8, newline included
+_TITLE_BYTES = (_TITLE_SCREEN + '\n').encode('utf-8')
+_GAME_OVER_BYTES = (_GAME_OVER_SCREEN + '\n').encode('utf-8')
+_VICTORY_BYTES = (_VICTORY_SCREEN + '\n').encode('utf-8')
+
+
+def _write_screen(text: str, data: bytes):
+    """Write screen art, skipping the text encoder when stdout is UTF-8 bytes."""
+    out = sys.stdout
+    buffer = getattr(out, 'buffer', None)
+    encoding = (getattr(out, 'encoding', None) or '').lower().replace('-', '')
+    if buffer is None or encoding != 'utf8':
+        out.write(text + '\n')
+        return
+
+    out.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def display_title_screen():
+    """Display the game title screen."""
+    clear_screen()
+    _write_screen(_TITLE_SCREEN, _TITLE_BYTES)
+
+
+def display_game_over():
+    """Display game over screen."""
+    clear_screen()
+    _write_screen(_GAME_OVER_SCREEN, _GAME_OVER_BYTES)
+
+
+def display_victory():
+    """Display victory screen."""
+    clear_screen()
+    _write_screen(_VICTORY_SCREEN, _VICTORY_BYTES)
+
+
 def loading_animation(text: str = "Loading", duration: float = 2.0):
     """Display a loading animation."""
+    if not _animations_enabled():
+        print(f"{text} Done!")
+        return
+
     chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
     start_time = time.time()
 
@@ -3,18 +3,46 @@ World module - Manages locations, exploration, and world navigation.
 """
 
 from typing import Dict, List, Optional, Set
-from enum import Enum
+from enum import IntEnum
 import random
+import sys
+import warnings
 
 
-class LocationType(Enum):
+class LocationType(IntEnum):
     """Types of locations."""
-    TOWN = "town"
-    DUNGEON = "dungeon"
-    WILDERNESS = "wilderness"
-    CAVE = "cave"
-    CASTLE = "castle"
-    RUINS = "ruins"
+    TOWN = 0
+    DUNGEON = 1
+    WILDERNESS = 2
+    CAVE = 3
+    CASTLE = 4
+    RUINS = 5
+
+
+_LOCATION_TYPE_NAME = {
+    LocationType.TOWN: "town",
+    LocationType.DUNGEON: "dungeon",
+    LocationType.WILDERNESS: "wilderness",
+    LocationType.CAVE: "cave",
+    LocationType.CASTLE: "castle",
+    LocationType.RUINS: "ruins"
+}
+
+
+_RULE = "=" * 60
+
+# Where a new game starts, and where the map must be reachable from
+START_LOCATION_ID = "hometown"
+
+# Random encounter chance per location type; other types use the default
+_ENCOUNTER_CHANCE = {
+    LocationType.TOWN: 0.0,
+    LocationType.WILDERNESS: 0.3,
+    LocationType.CAVE: 0.5,
+    LocationType.DUNGEON: 0.6,
+    LocationType.RUINS: 0.5,
+}
+_DEFAULT_ENCOUNTER_CHANCE = 0.3
 
 
 class Location:
@@ -22,6 +50,14 @@ class Location:
     Represents a location in the game world.
     """
 
+    __slots__ = (
+        'location_id', 'name', 'description', 'location_type', 'level_range',
+        'connections', 'has_shop', 'has_inn', 'enemy_encounters',
+        'treasure_items', 'visited', '_found_mask', '_full_mask', '_has_treasure',
+        '_name_upper', '_type_title', '_travel_suffix', '_encounter_chance',
+        '_conn_objs', '_conn_set'
+    )
+
     def __init__(self, location_id: str, name: str, description: str,
                  location_type: LocationType, level_range: tuple = (1, 99),
                  connections: List[str] = None,
@@ -34,61 +70,72 @@ class Location:
         self.description = description
         self.location_type = location_type
         self.level_range = level_range
-        self.connections = connections or []  # IDs of connected locations
+        self.connections = list(connections or ())  # IDs of connected locations
         self.has_shop = has_shop
         self.has_inn = has_inn
-        self.enemy_encounters = enemy_encounters or []  # Enemy IDs
-        self.treasure_items = treasure_items or []  # Item IDs
+        # Enemy and item IDs repeat across locations; intern them so every
+        # location shares one string object per ID
+        self.enemy_encounters = tuple(sys.intern(e) for e in enemy_encounters or ())
+        self.treasure_items = tuple(sys.intern(t) for t in treasure_items or ())
         self.visited = False
-        self.treasures_found = set()  # Track which treasures have been found
 
-    def get_random_enemy(self) -> Optional[str]:
+        # Found treasures as a bitmask, one bit per index into treasure_items
+        self._full_mask = (1 << len(self.treasure_items)) - 1
+        self._set_found_mask(0)
+
+        # Display strings, fixed once the location is built
+        self._name_upper = name.upper()
+        self._type_title = _LOCATION_TYPE_NAME[location_type].title()
+        self._travel_suffix = f" {name} (Lv.{level_range[0]}-{level_range[1]})"
+
+        self._encounter_chance = _ENCOUNTER_CHANCE.get(location_type, _DEFAULT_ENCOUNTER_CHANCE)
+
+        # Connections resolved by World.finalize()
+        self._conn_objs: List['Location'] = []
+        self._conn_set: frozenset = frozenset()
+
+    def get_random_enemy(self, rng=random) -> Optional[str]:
         """Get a random enemy that can be encountered here."""
         if not self.enemy_encounters:
             return None
-        return random.choice(self.enemy_encounters)
+        return rng.choice(self.enemy_encounters)
 
     def get_encounter_chance(self) -> float:
         """Get the chance of random encounter in this location."""
-        if self.location_type == LocationType.TOWN:
-            return 0.0
-        elif self.location_type == LocationType.WILDERNESS:
-            return 0.3
-        elif self.location_type == LocationType.CAVE:
-            return 0.5
-        elif self.location_type == LocationType.DUNGEON:
-            return 0.6
-        elif self.location_type == LocationType.RUINS:
-            return 0.5
-        return 0.3
+        return self._encounter_chance
 
     def has_available_treasure(self) -> bool:
         """Check if there are unfound treasures."""
-        return len(self.treasures_found) < len(self.treasure_items)
+        return self._has_treasure
+
+    def _set_found_mask(self, mask: int):
+        """Record which treasures are found and whether any are left."""
+        self._found_mask = mask
+        self._has_treasure = mask != self._full_mask
 
-    def get_treasure(self) -> Optional[str]:
+    def get_treasure(self, rng=random) -> Optional[str]:
         """
         Get a treasure item if available.
-        Returns item ID or None.
+        Returns item ID or None. rng is anything with a choice() method,
+        the random module by default.
         """
-        available = [
-            item for item in self.treasure_items
-            if item not in self.treasures_found
-        ]
+        found = self._found_mask
+        if found == self._full_mask:
+            return None
 
+        available = [i for i in range(len(self.treasure_items)) if not found >> i & 1]
         if not available:
             return None
-
-        treasure = random.choice(available)
-        self.treasures_found.add(treasure)
-        return treasure
+        index = rng.choice(available)
+        self._set_found_mask(found | (1 << index))
+        return self.treasure_items[index]
 
     def reset_treasures(self):
         """Reset treasures (for respawning)."""
-        self.treasures_found.clear()
+        self._set_found_mask(0)
 
     def __str__(self) -> str:
-        return f"{self.name} ({self.location_type.value})"
+        return f"{self.name} ({_LOCATION_TYPE_NAME[self.location_type]})"
 
 
 class World:
@@ -96,13 +143,73 @@ class World:
     Manages the game world and navigation.
     """
 
+    __slots__ = ('locations', 'current_location_id', '_finalized', '_rng', '_random')
+
     def __init__(self):
         self.locations: Dict[str, Location] = {}
         self.current_location_id: Optional[str] = None
+        self._finalized = False
+        # Encounter rolls use this world's own generator, so they can be seeded
+        self._rng = random.Random()
+        self._random = self._rng.random
+
+    @property
+    def rng(self) -> random.Random:
+        """This world's random generator, for draws tied to exploring it."""
+        return self._rng
+
+    def seed(self, value=None):
+        """Seed this world's random generator, for reproducible exploration."""
+        self._rng.seed(value)
 
     def add_location(self, location: Location):
         """Add a location to the world."""
         self.locations[location.location_id] = location
+        self._finalized = False
+
+    def finalize(self):
+        """
+        Resolve every location's connections to Location objects once, so
+        travel doesn't look them up by ID on each call. After add_location it
+        runs lazily on the next move_to or get_available_destinations; call
+        it yourself after editing an existing location's connections or
+        location_type. Encounters read enemy_encounters directly, so edits to
+        it apply straight away.
+        Warns about connections to unknown IDs, which travel then ignores,
+        and about locations that can't be reached from the start.
+        """
+        locations = self.locations
+        for loc in locations.values():
+            resolved = []
+            for conn_id in loc.connections:
+                target = locations.get(conn_id)
+                if target is None:
+                    warnings.warn(f"Location '{loc.location_id}' connects to "
+                                  f"unknown location '{conn_id}'")
+                else:
+                    resolved.append(target)
+            loc._conn_objs = resolved
+            loc._conn_set = frozenset(target.location_id for target in resolved)
+            loc._encounter_chance = _ENCOUNTER_CHANCE.get(loc.location_type,
+                                                          _DEFAULT_ENCOUNTER_CHANCE)
+        self._finalized = True
+
+        start = locations.get(self.current_location_id or START_LOCATION_ID)
+        if start is None:
+            return
+
+        reached = {start.location_id}
+        frontier = [start]
+        while frontier:
+            for target in frontier.pop()._conn_objs:
+                if target.location_id not in reached:
+                    reached.add(target.location_id)
+                    frontier.append(target)
+
+        unreachable = [loc_id for loc_id in locations if loc_id not in reached]
+        if unreachable:
+            warnings.warn(f"Locations unreachable from '{start.location_id}': "
+                          f"{', '.join(unreachable)}")
 
     def get_location(self, location_id: str) -> Optional[Location]:
         """Get a location by ID."""
@@ -119,16 +226,19 @@ class World:
         Move to a new location.
         Returns True if successful.
         """
-        if location_id not in self.locations:
+        location = self.locations.get(location_id)
+        if location is None:
             return False
 
+        if not self._finalized:
+            self.finalize()
+
         # Check if accessible from current location
-        current = self.get_current_location()
-        if current and location_id not in current.connections:
+        current = self.locations.get(self.current_location_id)
+        if current and location_id not in current._conn_set:
             return False
 
         self.current_location_id = location_id
-        location = self.get_location(location_id)
         location.visited = True
         return True
 
@@ -138,304 +248,264 @@ class World:
         if not current:
             return []
 
-        destinations = []
-        for loc_id in current.connections:
-            loc = self.get_location(loc_id)
-            if loc:
-                destinations.append(loc)
-
-        return destinations
+        if not self._finalized:
+            self.finalize()
+        return list(current._conn_objs)
 
     def trigger_random_encounter(self) -> Optional[str]:
         """
         Check for random encounter in current location.
         Returns enemy ID if encounter triggered, None otherwise.
         """
-        current = self.get_current_location()
-        if not current:
+        current = self.locations.get(self.current_location_id)
+        if current is None:
+            return None
+
+        # Towns and places without enemies never roll at all
+        chance = current._encounter_chance
+        enemies = current.enemy_encounters
+        if not chance or not enemies:
             return None
 
-        encounter_chance = current.get_encounter_chance()
-        if random.random() < encounter_chance:
-            return current.get_random_enemy()
+        rnd = self._random
+        if rnd() < chance:
+            return enemies[int(rnd() * len(enemies))]
 
         return None
 
     def to_dict(self) -> Dict:
-        """Convert world state to dictionary for saving."""
-        locations_data = {}
-        for loc_id, loc in self.locations.items():
-            locations_data[loc_id] = {
-                'visited': loc.visited,
-                'treasures_found': list(loc.treasures_found)
-            }
+        """
+        Convert world state to dictionary for saving.
 
+        Only locations that differ from a fresh world are written, under the
+        short keys 'v' (visited) and 't' (found-treasure mask).
+        """
         return {
             'current_location_id': self.current_location_id,
-            'locations': locations_data
+            'locations': {
+                loc_id: {'v': loc.visited, 't': loc._found_mask}
+                for loc_id, loc in self.locations.items()
+                if loc.visited or loc._found_mask
+            }
         }
 
     def from_dict(self, data: Dict):
-        """Load world state from dictionary."""
+        """
+        Load world state from dictionary.
+
+        Expects a freshly created world: locations missing from the save
+        keep their defaults.
+        """
         self.current_location_id = data.get('current_location_id')
 
         locations_data = data.get('locations', {})
         for loc_id, loc_data in locations_data.items():
-            if loc_id in self.locations:
-                self.locations[loc_id].visited = loc_data.get('visited', False)
-                self.locations[loc_id].treasures_found = set(loc_data.get('treasures_found', []))
+            loc = self.locations.get(loc_id)
+            if loc is None:
+                continue
+
+            loc.visited = loc_data.get('v', loc_data.get('visited', False))
+            mask = loc_data.get('t')
+            if mask is None:
+                # Older saves list the IDs of the treasures found
+                found = set(loc_data.get('treasures_found', ()))
+                mask = sum(1 << i for i, item in enumerate(loc.treasure_items) if item in found)
+            # Ignore bits for treasures this location doesn't have
+            loc._set_found_mask(mask & loc._full_mask)
 
 
 # =============================================================================
 # WORLD CREATION
 # =============================================================================
 
-def create_game_world() -> World:
-    """Create and populate the game world."""
-    world = World()
-
+# Each row: (location_id, name, description, location_type, level_range,
+#            connections, has_shop, has_inn, enemy_encounters, treasure_items)
+LOCATION_TABLE = (
     # === TOWNS ===
 
-    world.add_location(Location(
-        "hometown", "Hometown Village",
-        "A peaceful village where your adventure begins. "
-        "Humble cottages line the dirt roads, and friendly villagers go about their daily lives.",
-        LocationType.TOWN,
-        level_range=(1, 99),
-        connections=["forest_path", "meadow"],
-        has_shop=True,
-        has_inn=True
-    ))
-
-    world.add_location(Location(
-        "port_city", "Port City",
-        "A bustling coastal city filled with merchants and sailors. "
-        "The smell of salt and fish fills the air.",
-        LocationType.TOWN,
-        level_range=(5, 99),
-        connections=["coastal_road", "city_outskirts"],
-        has_shop=True,
-        has_inn=True
-    ))
-
-    world.add_location(Location(
-        "mountain_village", "Mountain Village",
-        "A remote village nestled in the mountains. "
-        "The air is thin and cold, but the people are warm and welcoming.",
-        LocationType.TOWN,
-        level_range=(8, 99),
-        connections=["mountain_path", "snowy_peaks"],
-        has_shop=True,
-        has_inn=True
-    ))
+    ("hometown", "Hometown Village",
+     "A peaceful village where your adventure begins. "
+     "Humble cottages line the dirt roads, and friendly villagers go about their daily lives.",
+     LocationType.TOWN, (1, 99),
+     ("forest_path", "meadow"),
+     True, True,
+     (),
+     ()),
+    ("port_city", "Port City",
+     "A bustling coastal city filled with merchants and sailors. "
+     "The smell of salt and fish fills the air.",
+     LocationType.TOWN, (5, 99),
+     ("coastal_road", "city_outskirts"),
+     True, True,
+     (),
+     ()),
+    ("mountain_village", "Mountain Village",
+     "A remote village nestled in the mountains. "
+     "The air is thin and cold, but the people are warm and welcoming.",
+     LocationType.TOWN, (8, 99),
+     ("mountain_path", "snowy_peaks"),
+     True, True,
+     (),
+     ()),
 
     # === WILDERNESS AREAS ===
 
-    world.add_location(Location(
-        "meadow", "Sunny Meadow",
-        "A bright meadow filled with wildflowers. "
-        "Small creatures scurry through the tall grass.",
-        LocationType.WILDERNESS,
-        level_range=(1, 3),
-        connections=["hometown", "forest_path"],
-        enemy_encounters=["slime", "wolf"],
-        treasure_items=["health_potion_small", "bronze_ring"]
-    ))
-
-    world.add_location(Location(
-        "forest_path", "Forest Path",
-        "A winding path through dense woods. "
-        "The canopy above blocks out much of the sunlight.",
-        LocationType.WILDERNESS,
-        level_range=(2, 4),
-        connections=["hometown", "meadow", "dark_forest", "goblin_camp"],
-        enemy_encounters=["goblin", "wolf", "bandit"],
-        treasure_items=["health_potion_medium", "iron_sword", "leather_scrap"]
-    ))
-
-    world.add_location(Location(
-        "dark_forest", "Dark Forest",
-        "An ominous forest where few dare to venture. "
-        "Strange sounds echo through the twisted trees.",
-        LocationType.WILDERNESS,
-        level_range=(5, 7),
-        connections=["forest_path", "ancient_ruins", "witch_hut"],
-        enemy_encounters=["skeleton", "dark_mage", "wolf"],
-        treasure_items=["health_potion_large", "staff_mage", "enchanted_crystal"]
-    ))
-
-    world.add_location(Location(
-        "coastal_road", "Coastal Road",
-        "A scenic road following the coastline. "
-        "Waves crash against the rocky shore.",
-        LocationType.WILDERNESS,
-        level_range=(4, 6),
-        connections=["port_city", "beach_cave", "city_outskirts"],
-        enemy_encounters=["bandit", "orc"],
-        treasure_items=["silver_amulet", "health_potion_medium"]
-    ))
-
-    world.add_location(Location(
-        "mountain_path", "Mountain Path",
-        "A treacherous path winding up the mountain. "
-        "One wrong step could mean a fatal fall.",
-        LocationType.WILDERNESS,
-        level_range=(7, 9),
-        connections=["mountain_village", "snowy_peaks", "dragon_lair"],
-        enemy_encounters=["orc", "troll", "wyvern"],
-        treasure_items=["plate_armor", "health_potion_large", "ring_haste"]
-    ))
+    ("meadow", "Sunny Meadow",
+     "A bright meadow filled with wildflowers. "
+     "Small creatures scurry through the tall grass.",
+     LocationType.WILDERNESS, (1, 3),
+     ("hometown", "forest_path"),
+     False, False,
+     ("slime", "wolf"),
+     ("health_potion_small", "bronze_ring")),
+    ("forest_path", "Forest Path",
+     "A winding path through dense woods. "
+     "The canopy above blocks out much of the sunlight.",
+     LocationType.WILDERNESS, (2, 4),
+     ("hometown", "meadow", "dark_forest", "goblin_camp"),
+     False, False,
+     ("goblin", "wolf", "bandit"),
+     ("health_potion_medium", "iron_sword", "leather_scrap")),
+    ("dark_forest", "Dark Forest",
+     "An ominous forest where few dare to venture. "
+     "Strange sounds echo through the twisted trees.",
+     LocationType.WILDERNESS, (5, 7),
+     ("forest_path", "ancient_ruins", "witch_hut"),
+     False, False,
+     ("skeleton", "dark_mage", "wolf"),
+     ("health_potion_large", "staff_mage", "enchanted_crystal")),
+    ("coastal_road", "Coastal Road",
+     "A scenic road following the coastline. "
+     "Waves crash against the rocky shore.",
+     LocationType.WILDERNESS, (4, 6),
+     ("port_city", "beach_cave", "city_outskirts"),
+     False, False,
+     ("bandit", "orc"),
+     ("silver_amulet", "health_potion_medium")),
+    ("mountain_path", "Mountain Path",
+     "A treacherous path winding up the mountain. "
+     "One wrong step could mean a fatal fall.",
+     LocationType.WILDERNESS, (7, 9),
+     ("mountain_village", "snowy_peaks", "dragon_lair"),
+     False, False,
+     ("orc", "troll", "wyvern"),
+     ("plate_armor", "health_potion_large", "ring_haste")),
 
     # === DUNGEONS & CAVES ===
 
-    world.add_location(Location(
-        "goblin_camp", "Goblin Camp",
-        "A ramshackle camp full of goblins. "
-        "Crude weapons and stolen goods are scattered everywhere.",
-        LocationType.DUNGEON,
-        level_range=(3, 5),
-        connections=["forest_path"],
-        enemy_encounters=["goblin", "goblin_chief", "bandit"],
-        treasure_items=["steel_sword", "chain_mail", "health_potion_medium", "iron_ore"]
-    ))
-
-    world.add_location(Location(
-        "beach_cave", "Beach Cave",
-        "A damp cave carved by the sea. "
-        "Water drips from the ceiling and pools on the floor.",
-        LocationType.CAVE,
-        level_range=(4, 6),
-        connections=["coastal_road"],
-        enemy_encounters=["bandit", "skeleton"],
-        treasure_items=["silver_ore", "health_potion_large", "leather_armor"]
-    ))
-
-    world.add_location(Location(
-        "abandoned_mine", "Abandoned Mine",
-        "An old mine shaft that goes deep underground. "
-        "Support beams creak ominously in the darkness.",
-        LocationType.CAVE,
-        level_range=(6, 8),
-        connections=["city_outskirts"],
-        enemy_encounters=["skeleton", "orc", "troll"],
-        treasure_items=["steel_ingot", "iron_ore", "health_potion_large", "ring_strength"]
-    ))
-
-    world.add_location(Location(
-        "crystal_cavern", "Crystal Cavern",
-        "A beautiful cavern filled with glowing crystals. "
-        "The air hums with magical energy.",
-        LocationType.CAVE,
-        level_range=(8, 10),
-        connections=["snowy_peaks"],
-        enemy_encounters=["dark_mage", "demon"],
-        treasure_items=[
-            "enchanted_crystal", "enchanted_crystal", "staff_mage",
-            "health_potion_supreme", "elixir_vitality"
-        ]
-    ))
+    ("goblin_camp", "Goblin Camp",
+     "A ramshackle camp full of goblins. "
+     "Crude weapons and stolen goods are scattered everywhere.",
+     LocationType.DUNGEON, (3, 5),
+     ("forest_path",),
+     False, False,
+     ("goblin", "goblin_chief", "bandit"),
+     ("steel_sword", "chain_mail", "health_potion_medium", "iron_ore")),
+    ("beach_cave", "Beach Cave",
+     "A damp cave carved by the sea. "
+     "Water drips from the ceiling and pools on the floor.",
+     LocationType.CAVE, (4, 6),
+     ("coastal_road",),
+     False, False,
+     ("bandit", "skeleton"),
+     ("silver_ore", "health_potion_large", "leather_armor")),
+    ("abandoned_mine", "Abandoned Mine",
+     "An old mine shaft that goes deep underground. "
+     "Support beams creak ominously in the darkness.",
+     LocationType.CAVE, (6, 8),
+     ("city_outskirts",),
+     False, False,
+     ("skeleton", "orc", "troll"),
+     ("steel_ingot", "iron_ore", "health_potion_large", "ring_strength")),
+    ("crystal_cavern", "Crystal Cavern",
+     "A beautiful cavern filled with glowing crystals. "
+     "The air hums with magical energy.",
+     LocationType.CAVE, (8, 10),
+     ("snowy_peaks",),
+     False, False,
+     ("dark_mage", "demon"),
+     ("enchanted_crystal", "enchanted_crystal", "staff_mage",
+      "health_potion_supreme", "elixir_vitality")),
 
     # === RUINS & SPECIAL LOCATIONS ===
 
-    world.add_location(Location(
-        "ancient_ruins", "Ancient Ruins",
-        "Crumbling stone structures from a long-lost civilization. "
-        "Magic still lingers in the air.",
-        LocationType.RUINS,
-        level_range=(6, 8),
-        connections=["dark_forest"],
-        enemy_encounters=["skeleton", "vampire", "dark_mage"],
-        treasure_items=[
-            "silver_rapier", "amulet_protection", "health_potion_large",
-            "ancient_key", "enchanted_crystal"
-        ]
-    ))
-
-    world.add_location(Location(
-        "witch_hut", "Witch's Hut",
-        "A mysterious hut deep in the forest. "
-        "Strange herbs and potions line the shelves.",
-        LocationType.RUINS,
-        level_range=(5, 7),
-        connections=["dark_forest"],
-        has_shop=True,  # Witch sells rare items
-        enemy_encounters=["dark_mage"],
-        treasure_items=["phoenix_down", "elixir_vitality", "rare_herb"]
-    ))
-
-    world.add_location(Location(
-        "dragon_lair", "Dragon's Lair",
-        "A massive cave that reeks of sulfur and charred bones. "
-        "This is the home of an ancient dragon.",
-        LocationType.CAVE,
-        level_range=(15, 20),
-        connections=["mountain_path"],
-        enemy_encounters=["dragon", "wyvern"],
-        treasure_items=[
-            "dragon_slayer", "dragon_armor", "dragon_scale",
-            "health_potion_supreme", "phoenix_down", "excalibur"
-        ]
-    ))
-
-    world.add_location(Location(
-        "cursed_castle", "Cursed Castle",
-        "An ancient castle shrouded in darkness. "
-        "Undead creatures roam its halls, serving the Lich King.",
-        LocationType.CASTLE,
-        level_range=(18, 20),
-        connections=["city_outskirts"],
-        enemy_encounters=["vampire", "skeleton", "lich"],
-        treasure_items=[
-            "excalibur", "celestial_robe", "crown_wisdom",
-            "pendant_phoenix", "phoenix_down", "star_fragment"
-        ]
-    ))
+    ("ancient_ruins", "Ancient Ruins",
+     "Crumbling stone structures from a long-lost civilization. "
+     "Magic still lingers in the air.",
+     LocationType.RUINS, (6, 8),
+     ("dark_forest",),
+     False, False,
+     ("skeleton", "vampire", "dark_mage"),
+     ("silver_rapier", "amulet_protection", "health_potion_large",
+      "ancient_key", "enchanted_crystal")),
+    ("witch_hut", "Witch's Hut",
+     "A mysterious hut deep in the forest. "
+     "Strange herbs and potions line the shelves.",
+     LocationType.RUINS, (5, 7),
+     ("dark_forest",),
+     True, False,  # Witch sells rare items
+     ("dark_mage",),
+     ("phoenix_down", "elixir_vitality", "rare_herb")),
+    ("dragon_lair", "Dragon's Lair",
+     "A massive cave that reeks of sulfur and charred bones. "
+     "This is the home of an ancient dragon.",
+     LocationType.CAVE, (15, 20),
+     ("mountain_path",),
+     False, False,
+     ("dragon", "wyvern"),
+     ("dragon_slayer", "dragon_armor", "dragon_scale",
+      "health_potion_supreme", "phoenix_down", "excalibur")),
+    ("cursed_castle", "Cursed Castle",
+     "An ancient castle shrouded in darkness. "
+     "Undead creatures roam its halls, serving the Lich King.",
+     LocationType.CASTLE, (18, 20),
+     ("city_outskirts",),
+     False, False,
+     ("vampire", "skeleton", "lich"),
+     ("excalibur", "celestial_robe", "crown_wisdom",
+      "pendant_phoenix", "phoenix_down", "star_fragment")),
 
     # === CONNECTING AREAS ===
 
-    world.add_location(Location(
-        "city_outskirts", "City Outskirts",
-        "The outer edges of the port city. "
-        "Less safe than the city proper, but still civilized.",
-        LocationType.WILDERNESS,
-        level_range=(5, 7),
-        connections=["port_city", "coastal_road", "abandoned_mine", "cursed_castle"],
-        enemy_encounters=["bandit", "orc"],
-        treasure_items=["health_potion_medium", "leather_armor"]
-    ))
-
-    world.add_location(Location(
-        "snowy_peaks", "Snowy Peaks",
-        "The highest peaks of the mountain range. "
-        "Howling winds and blinding snow make travel dangerous.",
-        LocationType.WILDERNESS,
-        level_range=(9, 12),
-        connections=["mountain_village", "mountain_path", "crystal_cavern"],
-        enemy_encounters=["wyvern", "troll", "demon"],
-        treasure_items=[
-            "dragon_scale", "health_potion_supreme",
-            "ring_haste", "phoenix_down"
-        ]
-    ))
+    ("city_outskirts", "City Outskirts",
+     "The outer edges of the port city. "
+     "Less safe than the city proper, but still civilized.",
+     LocationType.WILDERNESS, (5, 7),
+     ("port_city", "coastal_road", "abandoned_mine", "cursed_castle"),
+     False, False,
+     ("bandit", "orc"),
+     ("health_potion_medium", "leather_armor")),
+    ("snowy_peaks", "Snowy Peaks",
+     "The highest peaks of the mountain range. "
+     "Howling winds and blinding snow make travel dangerous.",
+     LocationType.WILDERNESS, (9, 12),
+     ("mountain_village", "mountain_path", "crystal_cavern"),
+     False, False,
+     ("wyvern", "troll", "demon"),
+     ("dragon_scale", "health_potion_supreme", "ring_haste", "phoenix_down")),
+)
+
+
+def create_game_world() -> World:
+    """Create and populate the game world."""
+    world = World()
+    for row in LOCATION_TABLE:
+        world.add_location(Location(*row))
+    world.finalize()
 
     # Set starting location
-    world.current_location_id = "hometown"
-    world.locations["hometown"].visited = True
+    world.current_location_id = START_LOCATION_ID
+    world.locations[START_LOCATION_ID].visited = True
 
     return world
 
 
 def display_location(location: Location, detailed: bool = True) -> str:
     """Format location information for display."""
-    output = []
-    output.append(f"\n{'='*60}")
-    output.append(f"📍 {location.name.upper()}")
-    output.append(f"{'='*60}")
-    output.append(f"\n{location.description}")
-
+    details = ""
     if detailed:
-        output.append(f"\nType: {location.location_type.value.title()}")
-        output.append(f"Recommended Level: {location.level_range[0]}-{location.level_range[1]}")
+        details = (f"\n\nType: {location._type_title}"
+                   f"\nRecommended Level: {location.level_range[0]}-{location.level_range[1]}")
 
         features = []
         if location.has_shop:
@@ -448,10 +518,10 @@ def display_location(location: Location, detailed: bool = True) -> str:
             features.append("💎 Treasure")
 
         if features:
-            output.append(f"\nFeatures: {' | '.join(features)}")
+            details += f"\n\nFeatures: {' | '.join(features)}"
 
-    output.append(f"{'='*60}\n")
-    return '\n'.join(output)
+    return (f"\n{_RULE}\n📍 {location._name_upper}\n{_RULE}\n"
+            f"\n{location.description}{details}\n{_RULE}\n")
 
 
 def display_travel_options(world: World) -> str:
@@ -461,11 +531,7 @@ def display_travel_options(world: World) -> str:
     if not destinations:
         return "\nNo destinations available from here.\n"
 
-    output = []
-    output.append("\n--- Available Destinations ---")
-
-    for i, dest in enumerate(destinations, 1):
-        visited_marker = "✓" if dest.visited else "?"
-        output.append(f"{i}. {visited_marker} {dest.name} (Lv.{dest.level_range[0]}-{dest.level_range[1]})")
-
+    output = ["\n--- Available Destinations ---"]
+    output.extend(f"{i}. {'✓' if dest.visited else '?'}{dest._travel_suffix}"
+                  for i, dest in enumerate(destinations, 1))
     return '\n'.join(output)